@@ -0,0 +1,37 @@
+"""Denormalized users.follower_count
+
+Revision ID: 002_follower_count
+Revises: 001_phase1_phase2
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "002_follower_count"
+down_revision = "001_phase1_phase2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE users ADD COLUMN IF NOT EXISTS follower_count INTEGER NOT NULL DEFAULT 0;
+        """
+    )
+    op.execute(
+        """
+        UPDATE users u
+        SET follower_count = f.cnt
+        FROM (
+            SELECT following_id, COUNT(*) AS cnt
+            FROM follows
+            GROUP BY following_id
+        ) f
+        WHERE u.id = f.following_id;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS follower_count;")
@@ -0,0 +1,26 @@
+"""Composite index for point history keyset pagination
+
+Revision ID: 003_point_logs_keyset
+Revises: 002_follower_count
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "003_point_logs_keyset"
+down_revision = "002_follower_count"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_point_logs_user_created_id
+            ON point_logs (user_id, created_at, id);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_point_logs_user_created_id;")
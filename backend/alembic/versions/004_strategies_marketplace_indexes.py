@@ -0,0 +1,33 @@
+"""Marketplace sort indexes on strategies
+
+Revision ID: 004_strategies_marketplace
+Revises: 003_point_logs_keyset
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "004_strategies_marketplace"
+down_revision = "003_point_logs_keyset"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_strategies_public_copy_count
+            ON strategies (is_public, copy_count, id);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_strategies_public_created_at
+            ON strategies (is_public, created_at, id);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_strategies_public_created_at;")
+    op.execute("DROP INDEX IF EXISTS ix_strategies_public_copy_count;")
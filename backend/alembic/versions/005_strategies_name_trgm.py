@@ -0,0 +1,31 @@
+"""Trigram index for marketplace strategy name search
+
+Revision ID: 005_strategies_name_trgm
+Revises: 004_strategies_marketplace
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "005_strategies_name_trgm"
+down_revision = "004_strategies_marketplace"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets the planner serve `name ILIKE '%term%'` from an index instead of a
+    # sequential scan. Built concurrently, which cannot run inside a transaction.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_strategies_name_trgm
+                ON strategies USING GIN (name gin_trgm_ops);
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_strategies_name_trgm;")
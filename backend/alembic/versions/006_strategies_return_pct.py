@@ -0,0 +1,40 @@
+"""Generated backtest_total_return_pct column for the marketplace profit sort
+
+Revision ID: 006_strategies_return_pct
+Revises: 005_strategies_name_trgm
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "006_strategies_return_pct"
+down_revision = "005_strategies_name_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Non-numeric values become NULL instead of failing the cast on write.
+    op.execute(
+        """
+        ALTER TABLE strategies
+            ADD COLUMN IF NOT EXISTS backtest_total_return_pct double precision
+            GENERATED ALWAYS AS (
+                CASE WHEN jsonb_typeof(backtest_result->'total_return_pct') = 'number'
+                THEN (backtest_result->>'total_return_pct')::double precision END
+            ) STORED;
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_strategies_public_return_pct
+                ON strategies (is_public, backtest_total_return_pct DESC NULLS LAST, id DESC);
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_strategies_public_return_pct;")
+    op.execute("ALTER TABLE strategies DROP COLUMN IF EXISTS backtest_total_return_pct;")
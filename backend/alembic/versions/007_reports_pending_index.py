@@ -0,0 +1,28 @@
+"""Partial index on pending reports
+
+Revision ID: 007_reports_pending
+Revises: 006_strategies_return_pct
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "007_reports_pending"
+down_revision = "006_strategies_return_pct"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The moderation queue only ever lists pending reports; this index stays
+    # small no matter how many reviewed/dismissed rows accumulate.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_reports_pending_created_at
+            ON reports (created_at) WHERE status = 'pending';
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_reports_pending_created_at;")
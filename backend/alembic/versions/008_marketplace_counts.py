@@ -0,0 +1,83 @@
+"""Trigger-maintained marketplace_counts table
+
+Revision ID: 008_marketplace_counts
+Revises: 007_reports_pending
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "008_marketplace_counts"
+down_revision = "007_reports_pending"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per (pair, timeframe) plus the '' ("any") roll-ups, so the
+    # marketplace total for any pair/timeframe filter is a primary-key lookup.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS marketplace_counts (
+            pair VARCHAR(20) NOT NULL DEFAULT '',
+            timeframe VARCHAR(10) NOT NULL DEFAULT '',
+            total INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (pair, timeframe)
+        );
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION marketplace_counts_bump(p TEXT, tf TEXT, delta INTEGER)
+        RETURNS void AS $$
+        BEGIN
+            INSERT INTO marketplace_counts AS mc (pair, timeframe, total)
+            VALUES (p, tf, delta), (p, '', delta), ('', tf, delta), ('', '', delta)
+            ON CONFLICT (pair, timeframe) DO UPDATE SET total = mc.total + EXCLUDED.total;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION strategies_marketplace_counts()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' AND OLD.is_public THEN
+                PERFORM marketplace_counts_bump(OLD.pair, OLD.timeframe, -1);
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.is_public THEN
+                PERFORM marketplace_counts_bump(NEW.pair, NEW.timeframe, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_strategies_marketplace_counts ON strategies;")
+    op.execute(
+        """
+        CREATE TRIGGER trg_strategies_marketplace_counts
+            AFTER INSERT OR DELETE OR UPDATE OF is_public, pair, timeframe ON strategies
+            FOR EACH ROW EXECUTE FUNCTION strategies_marketplace_counts();
+        """
+    )
+    # Backfill from the current rows; pair/timeframe are NOT NULL, so NULLs
+    # here only come from the roll-up grouping sets.
+    op.execute("DELETE FROM marketplace_counts;")
+    op.execute(
+        """
+        INSERT INTO marketplace_counts (pair, timeframe, total)
+        SELECT COALESCE(pair, ''), COALESCE(timeframe, ''), count(*)
+        FROM strategies
+        WHERE is_public
+        GROUP BY GROUPING SETS ((pair, timeframe), (pair), (timeframe), ());
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_strategies_marketplace_counts ON strategies;")
+    op.execute("DROP FUNCTION IF EXISTS strategies_marketplace_counts();")
+    op.execute("DROP FUNCTION IF EXISTS marketplace_counts_bump(TEXT, TEXT, INTEGER);")
+    op.execute("DROP TABLE IF EXISTS marketplace_counts;")
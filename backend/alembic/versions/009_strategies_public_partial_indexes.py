@@ -0,0 +1,43 @@
+"""Partial marketplace indexes on public strategies
+
+Revision ID: 009_strategies_public_partial
+Revises: 008_marketplace_counts
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "009_strategies_public_partial"
+down_revision = "008_marketplace_counts"
+branch_labels = None
+depends_on = None
+
+_PARTIAL_INDEXES = {
+    "ix_strategies_public_copies": "(copy_count DESC, id DESC)",
+    "ix_strategies_public_created": "(created_at DESC, id DESC)",
+    "ix_strategies_public_profit": "(backtest_total_return_pct DESC NULLS LAST, id DESC)",
+    "ix_strategies_public_pair_timeframe": "(pair, timeframe)",
+}
+
+# Composite (is_public, ...) indexes from 004/006, superseded by the partial ones.
+_REPLACED_INDEXES = {
+    "ix_strategies_public_copy_count": "(is_public, copy_count, id)",
+    "ix_strategies_public_created_at": "(is_public, created_at, id)",
+    "ix_strategies_public_return_pct": "(is_public, backtest_total_return_pct DESC NULLS LAST, id DESC)",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, cols in _PARTIAL_INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON strategies {cols} WHERE is_public;")
+        for name in _REPLACED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, cols in _REPLACED_INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON strategies {cols};")
+        for name in _PARTIAL_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
@@ -0,0 +1,47 @@
+"""Keyset pagination indexes and NOT NULL sort keys for the post list
+
+Revision ID: 010_posts_keyset
+Revises: 009_strategies_public_partial
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "010_posts_keyset"
+down_revision = "009_strategies_public_partial"
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    "ix_posts_pinned_created": "(is_pinned DESC, created_at DESC, id DESC)",
+    "ix_posts_pinned_likes": "(is_pinned DESC, like_count DESC, id DESC)",
+    "ix_posts_pinned_comments": "(is_pinned DESC, comment_count DESC, id DESC)",
+}
+
+
+# Keyset sort keys: a NULL drops its row out of the tuple comparison after the
+# first page, and a NULL last row can't be encoded into the cursor.
+_NOT_NULL_COLUMNS = {
+    "is_pinned": "false",
+    "like_count": "0",
+    "comment_count": "0",
+    "created_at": "now()",
+}
+
+
+def upgrade() -> None:
+    for col, default in _NOT_NULL_COLUMNS.items():
+        op.execute(f"UPDATE posts SET {col} = {default} WHERE {col} IS NULL;")
+        op.execute(f"ALTER TABLE posts ALTER COLUMN {col} SET DEFAULT {default}, ALTER COLUMN {col} SET NOT NULL;")
+
+    with op.get_context().autocommit_block():
+        for name, cols in _INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON posts {cols};")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+    for col in _NOT_NULL_COLUMNS:
+        op.execute(f"ALTER TABLE posts ALTER COLUMN {col} DROP NOT NULL, ALTER COLUMN {col} DROP DEFAULT;")
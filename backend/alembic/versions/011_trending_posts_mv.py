@@ -0,0 +1,36 @@
+"""Materialized view backing the trending posts endpoint
+
+Revision ID: 011_trending_posts_mv
+Revises: 010_posts_keyset
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "011_trending_posts_mv"
+down_revision = "010_posts_keyset"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS trending_posts_mv AS
+        SELECT id AS post_id,
+               like_count * 2 + comment_count * 3 + view_count AS engagement_score
+        FROM posts
+        WHERE created_at >= now() - interval '30 days'
+        WITH DATA;
+        """
+    )
+    # The unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_trending_posts_mv_post_id ON trending_posts_mv (post_id);")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_trending_posts_mv_score "
+        "ON trending_posts_mv (engagement_score DESC);"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS trending_posts_mv;")
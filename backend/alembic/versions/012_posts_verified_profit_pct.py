@@ -0,0 +1,41 @@
+"""Generated verified_profit_pct column on posts
+
+Revision ID: 012_posts_verified_profit_pct
+Revises: 011_trending_posts_mv
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "012_posts_verified_profit_pct"
+down_revision = "011_trending_posts_mv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Non-numeric values become NULL instead of failing the cast on write.
+    op.execute(
+        """
+        ALTER TABLE posts
+            ADD COLUMN IF NOT EXISTS verified_profit_pct double precision
+            GENERATED ALWAYS AS (
+                CASE WHEN jsonb_typeof(verified_profit->'total_return_pct') = 'number'
+                THEN (verified_profit->>'total_return_pct')::double precision END
+            ) STORED;
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_posts_verified_profit_pct
+                ON posts (verified_profit_pct DESC)
+                WHERE verified_profit IS NOT NULL;
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_posts_verified_profit_pct;")
+    op.execute("ALTER TABLE posts DROP COLUMN IF EXISTS verified_profit_pct;")
@@ -0,0 +1,30 @@
+"""Category-scoped post list index
+
+Revision ID: 013_posts_trending_covering
+Revises: 012_posts_verified_profit_pct
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "013_posts_trending_covering"
+down_revision = "012_posts_verified_profit_pct"
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    # list_posts filtered by category (pinned first, then newest).
+    "ix_posts_category_pinned_created": "(category, is_pinned DESC, created_at DESC, id DESC)",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, cols in _INDEXES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON posts {cols};")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
@@ -0,0 +1,31 @@
+"""Generated engagement_score column on posts
+
+Revision ID: 014_posts_engagement_score
+Revises: 013_posts_trending_covering
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "014_posts_engagement_score"
+down_revision = "013_posts_trending_covering"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE posts
+            ADD COLUMN IF NOT EXISTS engagement_score integer
+            GENERATED ALWAYS AS (
+                COALESCE(like_count, 0) * 2 + COALESCE(comment_count, 0) * 3 + COALESCE(view_count, 0)
+            ) STORED;
+        """
+    )
+    # Deliberately unindexed: the score moves with every view flush, and an
+    # index on it would turn those updates non-HOT.
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE posts DROP COLUMN IF EXISTS engagement_score;")
@@ -0,0 +1,29 @@
+"""Index for walking a post's comment tree
+
+Revision ID: 015_comments_post_parent
+Revises: 014_posts_engagement_score
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "015_comments_post_parent"
+down_revision = "014_posts_engagement_score"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_comments_post_parent "
+            "ON comments (post_id, parent_id, created_at);"
+        )
+        # (post_id) is a prefix of the new index.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_comments_post_id;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_comments_post_id ON comments (post_id);")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_comments_post_parent;")
@@ -0,0 +1,29 @@
+"""Partial index for the strategy ranking's week/month windows
+
+Revision ID: 016_posts_ranking_created
+Revises: 015_comments_post_parent
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "016_posts_ranking_created"
+down_revision = "015_comments_post_parent"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # now() is not immutable, so the window itself can't be the index predicate;
+    # the stable filters are, and created_at >= :cutoff becomes a range scan.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_posts_ranking_created "
+            "ON posts (created_at DESC) "
+            "WHERE verified_profit IS NOT NULL AND category IN ('strategy', 'profit');"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_posts_ranking_created;")
@@ -0,0 +1,31 @@
+"""Trigram index for user nickname search
+
+Revision ID: 017_users_nickname_trgm
+Revises: 016_posts_ranking_created
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "017_users_nickname_trgm"
+down_revision = "016_posts_ranking_created"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves search_users' `nickname ILIKE '%q%'` from an index; trigram GIN
+    # indexes handle ILIKE directly, so no lower(nickname) expression is needed.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_nickname_trgm
+                ON users USING GIN (nickname gin_trgm_ops);
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_nickname_trgm;")
@@ -0,0 +1,23 @@
+"""Disable JIT as the database default
+
+Revision ID: 018_database_jit_off
+Revises: 017_users_nickname_trgm
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "018_database_jit_off"
+down_revision = "017_users_nickname_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Connections through PgBouncer can't pass jit=off as a startup parameter,
+    # so make it the database default; new sessions pick it up on connect.
+    op.execute("DO $$ BEGIN EXECUTE format('ALTER DATABASE %I SET jit = off', current_database()); END $$")
+
+
+def downgrade() -> None:
+    op.execute("DO $$ BEGIN EXECUTE format('ALTER DATABASE %I RESET jit', current_database()); END $$")
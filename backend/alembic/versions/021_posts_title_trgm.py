@@ -0,0 +1,31 @@
+"""Trigram index for post title search
+
+Revision ID: 021_posts_title_trgm
+Revises: 018_database_jit_off
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "021_posts_title_trgm"
+down_revision = "018_database_jit_off"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves search_posts' `title ILIKE '%q%'` branch, which keeps mid-word
+    # substring matches that the word-prefix tsquery can't express.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_posts_title_trgm
+                ON posts USING GIN (title gin_trgm_ops);
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_posts_title_trgm;")
@@ -123,9 +123,10 @@ async def daily_check_in(
     user_points.total_points = (user_points.total_points or 0) + total_points
 
     # Update level
-    from core.points import compute_level
+    from core.points import compute_level, queue_leaderboard_sync
     level_num, _ = compute_level(user_points.total_points)
     user_points.level = level_num
+    queue_leaderboard_sync(db, user.id, user_points.total_points)
 
     # Log the points
     description = f"출석체크 (연속 {current_streak}일)"
@@ -16,7 +16,9 @@ from api.deps import (
     create_access_token, create_refresh_token, decode_token,
     get_current_user,
 )
-from core.points import compute_level, next_level_info
+from api.posts import invalidate_profile_cache
+from core.points import compute_level, next_level_info, cache_nickname
+from core.author_info import invalidate_author_info
 from middleware.rate_limit import rate_limit
 from config import get_settings
 
@@ -308,6 +310,10 @@ async def update_profile(
 
     await db.commit()
     await db.refresh(user)
+    if req.nickname is not None:
+        await cache_nickname(user.id, user.nickname)
+        await invalidate_author_info(user.id)
+        await invalidate_profile_cache(user.id)
     return {
         "id": str(user.id),
         "email": user.email,
@@ -0,0 +1,36 @@
+"""
+Batch lookups for per-viewer post state (liked / bookmarked) on list endpoints.
+"""
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Like, Bookmark
+
+
+async def batch_liked_post_ids(db: AsyncSession, user_id, post_ids) -> set[UUID]:
+    """Subset of post_ids the user has liked, in one IN query."""
+    if not post_ids:
+        return set()
+    rows = await db.execute(
+        select(Like.target_id).where(
+            Like.user_id == user_id,
+            Like.target_type == "post",
+            Like.target_id.in_(post_ids),
+        )
+    )
+    return set(rows.scalars())
+
+
+async def batch_bookmarked_post_ids(db: AsyncSession, user_id, post_ids) -> set[UUID]:
+    """Subset of post_ids the user has bookmarked, in one IN query."""
+    if not post_ids:
+        return set()
+    rows = await db.execute(
+        select(Bookmark.post_id).where(
+            Bookmark.user_id == user_id,
+            Bookmark.post_id.in_(post_ids),
+        )
+    )
+    return set(rows.scalars())
@@ -4,12 +4,13 @@ Sub-Community API: list, detail, posts, join, leave.
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update
+from sqlalchemy import select, func, update, exists
 from uuid import UUID
 
 from db.database import get_db
 from db.models import SubCommunity, SubCommunityMember, Post, User, UserPoints
 from api.deps import get_current_user, get_current_user_optional
+from api.posts import Timestamp, invalidate_personalized_feed
 from core.points import compute_level
 
 router = APIRouter(prefix="/api/communities", tags=["communities"])
@@ -60,7 +61,7 @@ class CommunityPostItem(BaseModel):
     has_strategy: bool
     verified_profit_pct: float | None = None
     is_pinned: bool = False
-    created_at: str
+    created_at: Timestamp
 
 
 # ─── List Communities ────────────────────────────────────────────────────────
@@ -116,11 +117,11 @@ async def get_community(
     # Check membership
     is_member = False
     if current_user:
-        member_stmt = select(SubCommunityMember).where(
+        member_stmt = select(exists().where(
             SubCommunityMember.user_id == current_user.id,
             SubCommunityMember.sub_community_id == community.id,
-        )
-        is_member = (await db.execute(member_stmt)).scalar_one_or_none() is not None
+        ))
+        is_member = bool((await db.execute(member_stmt)).scalar())
 
     return CommunityDetail(
         id=str(community.id),
@@ -156,7 +157,12 @@ async def list_community_posts(
         raise HTTPException(404, "커뮤니티를 찾을 수 없습니다.")
 
     stmt = (
-        select(Post, User.nickname, User.plan, UserPoints.total_points)
+        select(
+            Post.id, Post.user_id, Post.category, Post.title,
+            Post.like_count, Post.comment_count, Post.view_count, Post.strategy_id,
+            Post.verified_profit_pct, Post.is_pinned, Post.created_at,
+            User.nickname, User.plan, UserPoints.total_points,
+        )
         .join(User, Post.user_id == User.id)
         .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
         .where(Post.sub_community_id == community.id)
@@ -179,21 +185,18 @@ async def list_community_posts(
     return [
         CommunityPostItem(
             id=str(post.id),
-            author=_author(post.user_id, nickname, plan, pts),
+            author=_author(post.user_id, post.nickname, post.plan, post.total_points),
             category=post.category,
             title=post.title,
             like_count=post.like_count,
             comment_count=post.comment_count,
             view_count=post.view_count,
             has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
+            verified_profit_pct=post.verified_profit_pct,
             is_pinned=post.is_pinned,
-            created_at=str(post.created_at),
+            created_at=post.created_at,
         )
-        for post, nickname, plan, pts in rows
+        for post in rows
     ]
 
 
@@ -235,6 +238,7 @@ async def join_community(
     community.member_count = (community.member_count or 0) + 1
 
     await db.commit()
+    await invalidate_personalized_feed(user.id)
     return {"ok": True, "message": "커뮤니티에 가입했습니다."}
 
 
@@ -272,6 +276,7 @@ async def leave_community(
         community.member_count -= 1
 
     await db.commit()
+    await invalidate_personalized_feed(user.id)
     return {"ok": True, "message": "커뮤니티에서 탈퇴했습니다."}
 
 
@@ -21,15 +21,20 @@ async def dashboard_overview(
     db: AsyncSession = Depends(get_db),
 ):
     """메인 대시보드 데이터"""
-    # Bot stats
-    stmt = select(Bot).where(Bot.user_id == user.id)
-    result = await db.execute(stmt)
-    bots = result.scalars().all()
-
-    active_bots = len([b for b in bots if b.status == "running"])
-    total_profit = sum(float(b.total_profit or 0) for b in bots)
-    total_trades = sum(b.total_trades or 0 for b in bots)
-    total_wins = sum(b.win_trades or 0 for b in bots)
+    # Bot stats, counted and summed server-side
+    stmt = select(
+        func.count(),
+        func.count().filter(Bot.status == "running"),
+        func.count().filter(Bot.status == "paused"),
+        func.count().filter(Bot.status == "error"),
+        func.coalesce(func.sum(Bot.total_profit), 0),
+        func.coalesce(func.sum(Bot.total_trades), 0),
+        func.coalesce(func.sum(Bot.win_trades), 0),
+    ).where(Bot.user_id == user.id)
+    total_bots, active_bots, paused_bots, error_bots, total_profit, total_trades, total_wins = (
+        await db.execute(stmt)
+    ).one()
+    total_profit = float(total_profit)
 
     # Recent trades
     stmt = (
@@ -43,10 +48,10 @@ async def dashboard_overview(
 
     return {
         "bots": {
-            "total": len(bots),
+            "total": total_bots,
             "active": active_bots,
-            "paused": len([b for b in bots if b.status == "paused"]),
-            "error": len([b for b in bots if b.status == "error"]),
+            "paused": paused_bots,
+            "error": error_bots,
         },
         "performance": {
             "total_profit": round(total_profit, 0),
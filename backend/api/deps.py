@@ -1,6 +1,7 @@
 """
-API Dependencies: authentication, database session, plan limits.
+API Dependencies: authentication, database session, plan limits, pagination cursors.
 """
+import base64
 from datetime import datetime, timezone, timedelta
 from uuid import UUID
 from fastapi import Depends, HTTPException, Request, status
@@ -129,6 +130,41 @@ async def get_current_user_optional(
         return None
 
 
+# ─── Keyset pagination cursors ─────────────────────────────────────────────
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Opaque cursor for (created_at, id) keyset pagination."""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, row_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(ts), UUID(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+
+def encode_keyset_cursor(*parts) -> str:
+    """Opaque cursor for keyset pagination over an arbitrary sort key tuple."""
+    raw = "|".join(p.isoformat() if isinstance(p, datetime) else str(p) for p in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str, n_parts: int) -> list[str]:
+    """Raw string parts of a cursor from encode_keyset_cursor; callers convert types."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split("|", n_parts - 1)
+    except Exception:
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    if len(parts) != n_parts:
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    return parts
+
+
 # ─── No limits (community edition) ──────────────────────────────────────────
 
 def get_plan_limits(plan: str = "") -> dict:
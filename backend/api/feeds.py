@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
 import logging
+import re
 import time
 from typing import Annotated
 
 from fastapi import APIRouter, Query
 
 from config import get_settings
-from core.ai_translate import translate_text
+from core.ai_translate import translate_many
 from core.feed_reader import fetch_feed, FeedEntry
 from core.redis_cache import cache_get, cache_set
 
@@ -18,59 +21,88 @@ router = APIRouter(prefix="/api/feeds", tags=["feeds"])
 settings = get_settings()
 
 def _clamp(s: str, n: int) -> str:
-    s = (s or "").strip()
+    if not s:
+        return ""
+    if s[0].isspace() or s[-1].isspace():
+        s = s.strip()
     if len(s) <= n:
         return s
     return s[: max(0, n - 1)].rstrip() + "…"
 
 
+_CSV_RE = re.compile(r"[^,\s]+")
+
+# Default sources if not configured (real RSS, no fake data).
+_DEFAULT_NEWS_URLS = (
+    "https://cointelegraph.com/rss",
+    "https://www.coindesk.com/arc/outboundfeeds/rss/?outputType=xml",
+    "https://decrypt.co/feed",
+    "https://www.blockmedia.co.kr/feed",
+    "https://www.coindeskkorea.com/feed",
+)
+
+
 def _split_urls(raw: str) -> list[str]:
-    if not raw:
-        return []
-    out: list[str] = []
-    for part in raw.split(","):
-        u = part.strip()
-        if u:
-            out.append(u)
-    return out
+    return _CSV_RE.findall(raw) if raw else []
+
+
+# (needle, label) pairs checked in order against the lowercased feed URL.
+_SOURCE_LABELS = (
+    ("coindesk", "CoinDesk"),
+    ("cointelegraph", "Cointelegraph"),
+    ("decrypt", "Decrypt"),
+    ("rsshub", "RSSHub"),
+)
 
 
+@functools.lru_cache(maxsize=512)
 def _guess_source(url: str) -> str:
     u = (url or "").lower()
-    if "/twitter/user/" in u:
-        try:
-            handle = u.split("/twitter/user/", 1)[1].split("/", 1)[0].strip()
-            if handle:
-                return f"X@{handle}"
-        except Exception:
-            pass
-    if "coindesk" in u:
-        return "CoinDesk"
-    if "cointelegraph" in u:
-        return "Cointelegraph"
-    if "decrypt" in u:
-        return "Decrypt"
-    if "rsshub" in u:
-        return "RSSHub"
-    return url.split("/")[2] if "://" in url else url[:32]
+    _, sep, rest = u.partition("/twitter/user/")
+    if sep:
+        handle = rest.split("/", 1)[0].strip()
+        if handle:
+            return f"X@{handle}"
+    for needle, label in _SOURCE_LABELS:
+        if needle in u:
+            return label
+    return url.split("/", 3)[2] if "://" in url else url[:32]
+
+
+# Stop waiting on slow feeds once this much time has passed (or enough entries
+# arrived). Unfinished fetches keep running and warm the per-URL feed cache.
+_FEED_SOFT_DEADLINE_S = 1.5
+_background_fetches: set[asyncio.Task] = set()
 
 
 async def _load_feeds(urls: list[str], limit: int) -> list[FeedEntry]:
     if not urls:
         return []
-    results = await asyncio.gather(
-        *[fetch_feed(u, source=_guess_source(u)) for u in urls],
-        return_exceptions=True,
-    )
+    tasks = [asyncio.ensure_future(fetch_feed(u, source=_guess_source(u))) for u in urls]
     items: list[FeedEntry] = []
-    for r in results:
-        if isinstance(r, Exception):
-            continue
-        items.extend(r)
+    try:
+        for fut in asyncio.as_completed(tasks, timeout=_FEED_SOFT_DEADLINE_S):
+            try:
+                items.extend(await fut)
+            except Exception:
+                continue
+            if len(items) >= limit * 3:
+                break
+    except asyncio.TimeoutError:
+        if not items:
+            # Nothing arrived in time: wait for the rest rather than return empty.
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for r in results:
+                if not isinstance(r, Exception):
+                    items.extend(r)
+
+    for t in tasks:
+        if not t.done():
+            _background_fetches.add(t)
+            t.add_done_callback(_background_fetches.discard)
 
     # Sort by parsed timestamp (best-effort). Unknown dates go to the bottom.
-    items = sorted(items, key=lambda e: (e.published_ts is not None, e.published_ts or 0), reverse=True)
-    return items[:limit]
+    return heapq.nlargest(limit, items, key=lambda e: (e.published_ts is not None, e.published_ts or 0))
 
 
 @router.get("/news")
@@ -83,19 +115,13 @@ async def get_news(
     if cached is not None:
         return cached
 
-    # Default sources if not configured (real RSS, no fake data).
-    urls = _split_urls(settings.NEWS_FEED_URLS) or [
-        "https://cointelegraph.com/rss",
-        "https://www.coindesk.com/arc/outboundfeeds/rss/?outputType=xml",
-        "https://decrypt.co/feed",
-        "https://www.blockmedia.co.kr/feed",
-        "https://www.coindeskkorea.com/feed",
-    ]
+    urls = _split_urls(settings.NEWS_FEED_URLS) or list(_DEFAULT_NEWS_URLS)
     items = await _load_feeds(urls, limit=limit)
 
+    titles_ko = await translate_many([it.title for it in items]) if translate else [it.title for it in items]
+
     out = []
-    for it in items:
-        title_ko = await translate_text(it.title) if translate else it.title
+    for it, title_ko in zip(items, titles_ko):
         out.append(
             {
                 "source": it.source,
@@ -132,8 +158,7 @@ async def get_x_feed(
 
     settings = get_settings()
     auth_token = settings.TWITTER_AUTH_TOKEN.strip()
-    usernames_raw = settings.X_FEED_USERNAMES.strip()
-    usernames = [u.strip() for u in usernames_raw.split(",") if u.strip()] if usernames_raw else []
+    usernames = _split_urls(settings.X_FEED_USERNAMES)
 
     # ── 1. auth_token 스크래핑 ──
     if auth_token and usernames:
@@ -147,10 +172,10 @@ async def get_x_feed(
                 total_limit=limit,
             )
             if tweets:
+                titles = [_clamp(tw.text, 280) for tw in tweets]
+                titles_ko = await translate_many(titles) if translate else titles
                 out = []
-                for tw in tweets:
-                    title = _clamp(tw.text, 280)
-                    title_ko = await translate_text(title) if translate else title
+                for tw, title, title_ko in zip(tweets, titles, titles_ko):
                     out.append({
                         "source": f"@{tw.author_username}",
                         "title": title,
@@ -173,11 +198,14 @@ async def get_x_feed(
     urls = _split_urls(settings.X_FEED_URLS)
     if urls:
         items = await _load_feeds(urls, limit=limit)
+        titles = [it.title for it in items]
+        summaries = [_clamp(it.summary, 400) for it in items]
+        if translate:
+            titles_ko, summaries_ko = await asyncio.gather(translate_many(titles), translate_many(summaries))
+        else:
+            titles_ko, summaries_ko = titles, summaries
         out = []
-        for it in items:
-            title_ko = await translate_text(it.title) if translate else it.title
-            summary = _clamp((it.summary or "").strip(), 400)
-            summary_ko = await translate_text(summary) if (translate and summary) else summary
+        for it, title_ko, summary, summary_ko in zip(items, titles_ko, summaries, summaries_ko):
             out.append({
                 "source": it.source,
                 "title": _clamp(it.title, 160),
@@ -2,6 +2,7 @@
 Follow Feed API: posts from followed users
 """
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -49,21 +50,19 @@ async def get_following_feed(
 
         items.append({
             "type": feed_type,
-            "post_id": str(post.id),
+            "post_id": post.id,
             "title": post.title,
             "category": post.category,
             "author": {
-                "id": str(post.user_id),
+                "id": post.user_id,
                 "nickname": nickname,
                 "plan": plan,
             },
             "like_count": post.like_count,
             "comment_count": post.comment_count,
-            "verified_profit_pct": (
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            "created_at": str(post.created_at),
+            "verified_profit_pct": post.verified_profit_pct,
+            "created_at": post.created_at,
         })
 
-    return items
+    # orjson serializes the UUID/datetime values natively.
+    return ORJSONResponse(items)
@@ -4,13 +4,14 @@ Follow API: follow/unfollow users and list followers/following.
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, update
 from uuid import UUID
 
 from db.database import get_db
 from db.models import User, Follow
 from api.deps import get_current_user
 from api.notifications import create_notification
+from api.posts import invalidate_profile_cache, invalidate_personalized_feed
 
 router = APIRouter(prefix="/api/follows", tags=["follows"])
 
@@ -40,25 +41,30 @@ async def follow_user(
         return {"ok": True, "following": True}
 
     db.add(Follow(follower_id=user.id, following_id=target_uuid))
+    new_count = (await db.execute(
+        update(User)
+        .where(User.id == target_uuid)
+        .values(follower_count=User.follower_count + 1)
+        .returning(User.follower_count)
+    )).scalar() or 0
     await create_notification(
         db, user_id=target_uuid, actor_id=user.id,
         type="follow", message=f"{user.nickname}님이 회원님을 팔로우합니다",
     )
 
-    # Award follower milestone points
+    # Award follower milestone points (only when this follow crosses a threshold)
     try:
-        from core.points import award_points, FOLLOWER_MILESTONES
-        follower_count = (await db.execute(
-            select(func.count()).select_from(Follow).where(Follow.following_id == target_uuid)
-        )).scalar() or 0
-        new_count = follower_count + 1  # +1 for the new follow not yet flushed
-        for threshold, action_key in FOLLOWER_MILESTONES:
-            if new_count >= threshold:
-                await award_points(db, target_uuid, action_key, f"팔로워 {threshold}명 달성 보너스")
+        from core.points import award_points, FOLLOWER_MILESTONE_BY_COUNT
+        action_key = FOLLOWER_MILESTONE_BY_COUNT.get(new_count)
+        if action_key:
+            await award_points(db, target_uuid, action_key, f"팔로워 {new_count}명 달성 보너스")
     except Exception:
         pass
 
     await db.commit()
+    await invalidate_profile_cache(target_uuid)
+    await invalidate_profile_cache(user.id)
+    await invalidate_personalized_feed(user.id)
     return {"ok": True, "following": True}
 
 
@@ -73,10 +79,20 @@ async def unfollow_user(
     except Exception:
         raise HTTPException(400, "유효하지 않은 사용자 ID입니다.")
 
-    await db.execute(
+    result = await db.execute(
         delete(Follow).where(Follow.follower_id == user.id, Follow.following_id == target_uuid)
     )
+    if result.rowcount:
+        await db.execute(
+            update(User)
+            .where(User.id == target_uuid, User.follower_count > 0)
+            .values(follower_count=User.follower_count - 1)
+        )
     await db.commit()
+    if result.rowcount:
+        await invalidate_profile_cache(target_uuid)
+        await invalidate_profile_cache(user.id)
+        await invalidate_personalized_feed(user.id)
     return {"ok": True, "following": False}
 
 
@@ -85,9 +101,7 @@ async def my_follow_stats(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    follower_count = (await db.execute(
-        select(func.count()).select_from(Follow).where(Follow.following_id == user.id)
-    )).scalar() or 0
+    follower_count = user.follower_count or 0
     following_count = (await db.execute(
         select(func.count()).select_from(Follow).where(Follow.follower_id == user.id)
     )).scalar() or 0
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime, timezone
+from uuid import UUID
+import time
 
 from db.database import get_db
 from db.models import User, ExchangeKey
@@ -15,6 +17,37 @@ from core.upbit_client import UpbitClient
 
 router = APIRouter(prefix="/api/keys", tags=["keys"])
 
+# Authenticated clients reused across verify/balance calls, keyed by key id.
+# Keeps the decrypted credentials and the HTTP connection pool warm instead of
+# paying decrypt + TLS handshake on every request.
+_CLIENT_IDLE_TTL = 300  # seconds
+_client_pool: dict[UUID, tuple[UpbitClient, float]] = {}
+
+
+async def _evict_idle_clients(now: float):
+    stale = [kid for kid, (_, last_used) in _client_pool.items() if now - last_used > _CLIENT_IDLE_TTL]
+    for kid in stale:
+        client, _ = _client_pool.pop(kid)
+        await client.close()
+
+
+async def _get_client(key: ExchangeKey) -> UpbitClient:
+    now = time.monotonic()
+    await _evict_idle_clients(now)
+    entry = _client_pool.get(key.id)
+    if entry is not None:
+        client = entry[0]
+    else:
+        client = UpbitClient(decrypt_key(key.access_key_enc), decrypt_key(key.secret_key_enc))
+    _client_pool[key.id] = (client, now)
+    return client
+
+
+async def _drop_client(key_id: UUID):
+    entry = _client_pool.pop(key_id, None)
+    if entry is not None:
+        await entry[0].close()
+
 
 class KeyRegisterRequest(BaseModel):
     access_key: str
@@ -89,7 +122,6 @@ async def delete_key(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    from uuid import UUID
     stmt = select(ExchangeKey).where(ExchangeKey.id == UUID(key_id), ExchangeKey.user_id == user.id)
     result = await db.execute(stmt)
     key = result.scalar_one_or_none()
@@ -98,6 +130,7 @@ async def delete_key(
 
     await db.delete(key)
     await db.commit()
+    await _drop_client(key.id)
     return {"message": "삭제되었습니다."}
 
 
@@ -107,16 +140,16 @@ async def verify_key(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    from uuid import UUID
     stmt = select(ExchangeKey).where(ExchangeKey.id == UUID(key_id), ExchangeKey.user_id == user.id)
     result = await db.execute(stmt)
     key = result.scalar_one_or_none()
     if not key:
         raise HTTPException(404, "API 키를 찾을 수 없습니다.")
 
-    client = UpbitClient(decrypt_key(key.access_key_enc), decrypt_key(key.secret_key_enc))
+    client = await _get_client(key)
     is_valid = await client.verify_keys()
-    await client.close()
+    if not is_valid:
+        await _drop_client(key.id)
 
     key.is_valid = is_valid
     key.last_verified_at = datetime.now(timezone.utc)
@@ -131,18 +164,18 @@ async def get_balance(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    from uuid import UUID
     stmt = select(ExchangeKey).where(ExchangeKey.id == UUID(key_id), ExchangeKey.user_id == user.id)
     result = await db.execute(stmt)
     key = result.scalar_one_or_none()
     if not key:
         raise HTTPException(404, "API 키를 찾을 수 없습니다.")
 
-    client = UpbitClient(decrypt_key(key.access_key_enc), decrypt_key(key.secret_key_enc))
+    client = await _get_client(key)
     try:
         balance = await client.get_balance()
         return balance
     except Exception as e:
+        # Auth/permission failures would repeat on the pooled client (revoked
+        # key, rotated secret); rebuild it from the stored key next time.
+        await _drop_client(key.id)
         raise HTTPException(400, f"잔고 조회 실패: {str(e)}")
-    finally:
-        await client.close()
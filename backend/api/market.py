@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Query
@@ -14,6 +15,33 @@ DEFAULT_MARKETS = [
     "KRW-DOGE", "KRW-ADA", "KRW-AVAX", "KRW-DOT",
 ]
 
+# In-flight upstream fetches keyed by cache key, so concurrent cache misses
+# share a single Upbit call instead of each hitting the ticker API.
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _fetch_quotes(markets: list[str], cache_key: str) -> dict:
+    client = get_public_client()
+    tickers = await client.get_ticker(markets)
+
+    # Normalize fields so frontend doesn't depend on raw Upbit schema.
+    out = [
+        {
+            "market": t.get("market"),
+            "symbol": str(t.get("market", "")).replace("KRW-", ""),
+            "trade_price": float(t.get("trade_price", 0.0) or 0.0),
+            "signed_change_rate_pct": float(t.get("signed_change_rate", 0.0) or 0.0) * 100.0,
+            "change": t.get("change"),
+            "acc_trade_volume_24h": float(t.get("acc_trade_volume_24h", 0.0) or 0.0),
+            "timestamp": t.get("timestamp"),
+        }
+        for t in tickers
+    ]
+    result = {"quotes": out}
+    await cache_set(cache_key, result, ttl=2)  # 2초 캐시 (실시간 시세)
+    return result
+
+
 @router.get("/quotes")
 async def get_quotes(
     markets: Annotated[list[str] | None, Query(description="Upbit markets, e.g. KRW-BTC")] = None,
@@ -30,24 +58,9 @@ async def get_quotes(
     if cached is not None:
         return cached
 
-    client = get_public_client()
-    tickers = await client.get_ticker(markets)
-
-    # Normalize fields so frontend doesn't depend on raw Upbit schema.
-    out = []
-    for t in tickers:
-        out.append(
-            {
-                "market": t.get("market"),
-                "symbol": str(t.get("market", "")).replace("KRW-", ""),
-                "trade_price": float(t.get("trade_price", 0.0) or 0.0),
-                "signed_change_rate_pct": float(t.get("signed_change_rate", 0.0) or 0.0) * 100.0,
-                "change": t.get("change"),
-                "acc_trade_volume_24h": float(t.get("acc_trade_volume_24h", 0.0) or 0.0),
-                "timestamp": t.get("timestamp"),
-            }
-        )
-    result = {"quotes": out}
-    await cache_set(cache_key, result, ttl=10)  # 10초 캐시 (실시간 시세)
-    return result
-
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_quotes(markets, cache_key))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(cache_key, None))
+    return await asyncio.shield(task)
@@ -2,13 +2,36 @@
 Strategy Marketplace API
 """
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from db.database import get_db
-from db.models import User, Strategy
+from db.models import User, Strategy, MarketplaceCount
+from core.redis_cache import cache_get, cache_set
 
-router = APIRouter(prefix="/api/marketplace", tags=["marketplace"])
+router = APIRouter(prefix="/api/marketplace", tags=["marketplace"], default_response_class=ORJSONResponse)
+
+
+async def _public_total(db: AsyncSession, pair: str | None, timeframe: str | None) -> int:
+    """Trigger-maintained total for unsearched listings: a primary-key lookup."""
+    stmt = select(MarketplaceCount.total).where(
+        MarketplaceCount.pair == (pair or ""),
+        MarketplaceCount.timeframe == (timeframe or ""),
+    )
+    return (await db.execute(stmt)).scalar() or 0
+
+
+async def _count_strategies(db: AsyncSession, filters: list, cache_key: str) -> int:
+    """Total for searched listings, cached briefly per filter combination."""
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return int(cached)
+
+    count_stmt = select(func.count()).select_from(Strategy).where(*filters)
+    total = (await db.execute(count_stmt)).scalar() or 0
+    await cache_set(cache_key, total, ttl=60)
+    return total
 
 
 @router.get("")
@@ -21,69 +44,75 @@ async def list_marketplace(
     size: int = Query(20, ge=1, le=50),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = (
-        select(Strategy, User.nickname)
-        .join(User, Strategy.user_id == User.id)
-        .where(Strategy.is_public == True)
-    )
-
+    filters = [Strategy.is_public == True]
     if pair:
-        stmt = stmt.where(Strategy.pair == pair)
+        filters.append(Strategy.pair == pair)
     if timeframe:
-        stmt = stmt.where(Strategy.timeframe == timeframe)
+        filters.append(Strategy.timeframe == timeframe)
     if search:
-        stmt = stmt.where(Strategy.name.ilike(f"%{search}%"))
+        filters.append(Strategy.name.ilike(f"%{search}%"))
 
     if sort == "newest":
-        stmt = stmt.order_by(Strategy.created_at.desc())
+        order_by = [Strategy.created_at.desc(), Strategy.id.desc()]
     elif sort == "profit":
         # Sort by backtest return pct (nulls last)
-        stmt = stmt.order_by(
-            func.coalesce(
-                Strategy.backtest_result["total_return_pct"].as_float(), 0
-            ).desc()
-        )
+        order_by = [Strategy.backtest_total_return_pct.desc().nullslast(), Strategy.id.desc()]
     else:  # copies
-        stmt = stmt.order_by(Strategy.copy_count.desc())
+        order_by = [Strategy.copy_count.desc(), Strategy.id.desc()]
 
-    stmt = stmt.offset((page - 1) * size).limit(size)
+    # Deferred join: page through narrow ids first, then load the wide rows
+    # (config/backtest JSONB) and author nickname for just that page.
+    page_ids = (
+        select(Strategy.id)
+        .where(*filters)
+        .order_by(*order_by)
+        .offset((page - 1) * size)
+        .limit(size)
+        .scalar_subquery()
+    )
+    # Plain column rows rather than ORM entities: the list only reads a few
+    # fields, so skip identity-map/instrumentation work per row.
+    stmt = (
+        select(
+            Strategy.id, Strategy.name, Strategy.description, Strategy.pair, Strategy.timeframe,
+            Strategy.is_public, Strategy.copy_count, Strategy.user_id, Strategy.backtest_result,
+            Strategy.created_at, User.nickname,
+        )
+        .select_from(Strategy)
+        .join(User, Strategy.user_id == User.id)
+        .where(Strategy.id.in_(page_ids))
+        .order_by(*order_by)
+    )
+    # Both totals are cheap (a primary-key lookup, or a cached count), so they
+    # share the request's session rather than holding a second pooled connection.
     result = await db.execute(stmt)
-    rows = result.all()
-
+    if search:
+        count_key = f"marketplace:count:{pair or ''}:{timeframe or ''}:{search.lower()}"
+        total = await _count_strategies(db, filters, count_key)
+    else:
+        total = await _public_total(db, pair, timeframe)
     items = []
-    for s, nickname in rows:
-        bt = s.backtest_result or {}
+    for row in result.mappings():
+        bt = row["backtest_result"] or {}
         items.append({
-            "id": str(s.id),
-            "name": s.name,
-            "description": s.description,
-            "pair": s.pair,
-            "timeframe": s.timeframe,
-            "is_public": s.is_public,
-            "copy_count": s.copy_count or 0,
-            "author_nickname": nickname,
-            "author_id": str(s.user_id),
+            "id": row["id"],
+            "name": row["name"],
+            "description": row["description"],
+            "pair": row["pair"],
+            "timeframe": row["timeframe"],
+            "is_public": row["is_public"],
+            "copy_count": row["copy_count"] or 0,
+            "author_nickname": row["nickname"],
+            "author_id": row["user_id"],
             "backtest_summary": {
                 "total_return_pct": bt.get("total_return_pct"),
                 "win_rate": bt.get("win_rate"),
                 "total_trades": bt.get("total_trades"),
                 "max_drawdown_pct": bt.get("max_drawdown_pct"),
             } if bt else None,
-            "created_at": str(s.created_at),
+            "created_at": row["created_at"],
         })
 
-    # Total count for pagination
-    count_stmt = (
-        select(func.count())
-        .select_from(Strategy)
-        .where(Strategy.is_public == True)
-    )
-    if pair:
-        count_stmt = count_stmt.where(Strategy.pair == pair)
-    if timeframe:
-        count_stmt = count_stmt.where(Strategy.timeframe == timeframe)
-    if search:
-        count_stmt = count_stmt.where(Strategy.name.ilike(f"%{search}%"))
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    return {"items": items, "total": total, "page": page, "size": size}
+    # Returned as a response so orjson serializes the UUIDs/datetimes directly,
+    # skipping FastAPI's jsonable_encoder pass.
+    return ORJSONResponse({"items": items, "total": total, "page": page, "size": size})
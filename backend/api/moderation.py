@@ -1,17 +1,23 @@
 """
 Moderation API: report, block/unblock, admin actions.
 """
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update, func
+from sqlalchemy import select, delete, update, func, true
+from sqlalchemy.orm import contains_eager, raiseload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from uuid import UUID
 
 from db.database import get_db
 from db.models import User, Post, Comment, Report, Block, Badge, Notification, ModerationAction
 from api.deps import get_current_user, get_current_admin, get_current_moderator
+from api.posts import invalidate_comments_cache, invalidate_profile_cache
 
-router = APIRouter(prefix="/api/moderation", tags=["moderation"])
+router = APIRouter(prefix="/api/moderation", tags=["moderation"], default_response_class=ORJSONResponse)
 
 
 # ─── Report ─────────────────────────────────────────────────────────────────
@@ -50,31 +56,29 @@ async def create_report(
 
 @router.post("/block/{target_user_id}")
 async def block_user(
-    target_user_id: str,
+    target_user_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if target_user_id == str(user.id):
+    if target_user_id == user.id:
         raise HTTPException(400, "자기 자신을 차단할 수 없습니다.")
-    target_uuid = UUID(target_user_id)
-    existing = (await db.execute(
-        select(Block).where(Block.blocker_id == user.id, Block.blocked_id == target_uuid)
-    )).scalar_one_or_none()
-    if existing:
-        return {"ok": True, "blocked": True}
-    db.add(Block(blocker_id=user.id, blocked_id=target_uuid))
+    await db.execute(
+        pg_insert(Block)
+        .values(blocker_id=user.id, blocked_id=target_user_id)
+        .on_conflict_do_nothing(index_elements=["blocker_id", "blocked_id"])
+    )
     await db.commit()
     return {"ok": True, "blocked": True}
 
 
 @router.delete("/block/{target_user_id}")
 async def unblock_user(
-    target_user_id: str,
+    target_user_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await db.execute(
-        delete(Block).where(Block.blocker_id == user.id, Block.blocked_id == UUID(target_user_id))
+        delete(Block).where(Block.blocker_id == user.id, Block.blocked_id == target_user_id)
     )
     await db.commit()
     return {"ok": True, "blocked": False}
@@ -91,7 +95,7 @@ async def list_blocked(
         .where(Block.blocker_id == user.id)
     )
     rows = (await db.execute(stmt)).all()
-    return [{"user_id": str(r.id), "nickname": r.nickname} for r in rows]
+    return ORJSONResponse([{"user_id": r.id, "nickname": r.nickname} for r in rows])
 
 
 # ─── Admin Moderation ───────────────────────────────────────────────────────
@@ -104,35 +108,63 @@ async def list_reports(
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Report, User.nickname).join(User, Report.reporter_id == User.id)
+    stmt = (
+        select(Report)
+        .join(Report.reporter)
+        .options(contains_eager(Report.reporter), raiseload("*"))
+    )
     if status != "all":
         stmt = stmt.where(Report.status == status)
     stmt = stmt.order_by(Report.created_at.desc()).offset((page - 1) * size).limit(size)
-    rows = (await db.execute(stmt)).all()
-    return [
+    reports = (await db.execute(stmt)).scalars().all()
+    return ORJSONResponse([
         {
-            "id": str(r.id),
-            "reporter": nick,
+            "id": r.id,
+            "reporter": r.reporter.nickname,
             "target_type": r.target_type,
-            "target_id": str(r.target_id),
+            "target_id": r.target_id,
             "reason": r.reason,
             "description": r.description,
             "status": r.status,
-            "created_at": str(r.created_at),
+            "created_at": r.created_at,
         }
-        for r, nick in rows
-    ]
+        for r in reports
+    ])
+
+
+class BatchReviewRequest(BaseModel):
+    ids: list[UUID] = Field(..., min_length=1, max_length=200)
+    action: Literal["reviewed", "dismissed"]
+
+
+@router.post("/reports/review")
+async def review_reports(
+    req: BatchReviewRequest,
+    admin: User = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Review many reports in one UPDATE; rows already in the target status are skipped."""
+    result = await db.execute(
+        update(Report)
+        .where(Report.id.in_(req.ids), Report.status != req.action)
+        .values(status=req.action)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return {"ok": True, "updated": result.rowcount}
 
 
 @router.post("/reports/{report_id}/review")
 async def review_report(
-    report_id: str,
+    report_id: UUID,
     action: str = Query(..., pattern="^(reviewed|dismissed)$"),
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
     await db.execute(
-        update(Report).where(Report.id == UUID(report_id)).values(status=action)
+        update(Report)
+        .where(Report.id == report_id, Report.status != action)
+        .values(status=action)
     )
     await db.commit()
     return {"ok": True}
@@ -140,11 +172,11 @@ async def review_report(
 
 @router.post("/admin/pin/{post_id}")
 async def toggle_pin(
-    post_id: str,
+    post_id: UUID,
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    post = await db.get(Post, UUID(post_id))
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(404, "게시글을 찾을 수 없습니다.")
     post.is_pinned = not post.is_pinned
@@ -154,34 +186,53 @@ async def toggle_pin(
 
 @router.delete("/admin/post/{post_id}")
 async def admin_delete_post(
-    post_id: str,
+    post_id: UUID,
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    post = await db.get(Post, UUID(post_id))
-    if not post:
+    # Comments/bookmarks/images go via ON DELETE CASCADE foreign keys.
+    deleted = (await db.execute(
+        delete(Post).where(Post.id == post_id).returning(Post.id)
+    )).scalar_one_or_none()
+    if deleted is None:
         raise HTTPException(404, "게시글을 찾을 수 없습니다.")
-    await db.delete(post)
     await db.commit()
     return {"ok": True, "message": "관리자에 의해 삭제되었습니다."}
 
 
 @router.delete("/admin/comment/{comment_id}")
 async def admin_delete_comment(
-    comment_id: str,
+    comment_id: UUID,
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    comment = await db.get(Comment, UUID(comment_id))
-    if not comment:
+    # Soft-delete the comment and decrement the post's comment count in one statement.
+    soft_deleted = (
+        update(Comment)
+        .where(Comment.id == comment_id)
+        .values(is_deleted=True, content="(관리자에 의해 삭제된 댓글입니다)", updated_at=func.now())
+        .returning(Comment.post_id)
+        .cte("soft_deleted")
+    )
+    decremented = (
+        update(Post)
+        .where(Post.id.in_(select(soft_deleted.c.post_id)), Post.comment_count > 0)
+        .values(comment_count=Post.comment_count - 1, updated_at=func.now())
+        .returning(Post.user_id)
+        .cte("decremented")
+    )
+    row = (await db.execute(
+        select(soft_deleted.c.post_id, decremented.c.user_id)
+        .select_from(soft_deleted)
+        .outerjoin(decremented, true())
+    )).first()
+    if row is None:
         raise HTTPException(404, "댓글을 찾을 수 없습니다.")
-    comment.is_deleted = True
-    comment.content = "(관리자에 의해 삭제된 댓글입니다)"
-    # Decrement post comment count
-    post = await db.get(Post, comment.post_id)
-    if post and post.comment_count > 0:
-        post.comment_count -= 1
     await db.commit()
+    # Same invalidation as the author-facing delete_comment.
+    await invalidate_comments_cache(row.post_id)
+    if row.user_id:
+        await invalidate_profile_cache(row.user_id)
     return {"ok": True}
 
 
@@ -199,7 +250,7 @@ BADGE_TYPES = {
 
 @router.post("/admin/badge/{user_id}")
 async def award_badge(
-    user_id: str,
+    user_id: UUID,
     badge_type: str = Query(...),
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
@@ -207,28 +258,34 @@ async def award_badge(
     if badge_type not in BADGE_TYPES:
         raise HTTPException(400, f"유효하지 않은 뱃지입니다. 사용 가능: {list(BADGE_TYPES.keys())}")
 
-    existing = (await db.execute(
-        select(Badge).where(Badge.user_id == UUID(user_id), Badge.type == badge_type)
+    inserted = (await db.execute(
+        pg_insert(Badge)
+        .values(user_id=user_id, type=badge_type, label=BADGE_TYPES[badge_type])
+        .on_conflict_do_nothing(index_elements=["user_id", "type"])
+        .returning(Badge.id)
     )).scalar_one_or_none()
-    if existing:
-        return {"ok": True, "message": "이미 부여된 뱃지입니다."}
-
-    db.add(Badge(user_id=UUID(user_id), type=badge_type, label=BADGE_TYPES[badge_type]))
     await db.commit()
+    if inserted is None:
+        return {"ok": True, "message": "이미 부여된 뱃지입니다."}
     return {"ok": True, "message": f"'{BADGE_TYPES[badge_type]}' 뱃지가 부여되었습니다."}
 
 
 @router.get("/badges/{user_id}")
 async def get_user_badges(
-    user_id: str,
+    user_id: UUID,
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Badge).where(Badge.user_id == UUID(user_id)).order_by(Badge.awarded_at.desc())
+    stmt = (
+        select(Badge)
+        .where(Badge.user_id == user_id)
+        .order_by(Badge.awarded_at.desc())
+        .options(raiseload("*"))
+    )
     rows = (await db.execute(stmt)).scalars().all()
-    return [
-        {"type": b.type, "label": b.label, "awarded_at": str(b.awarded_at)}
+    return ORJSONResponse([
+        {"type": b.type, "label": b.label, "awarded_at": b.awarded_at}
         for b in rows
-    ]
+    ])
 
 
 # ─── Moderation Queue (Moderator+) ────────────────────────────────────────
@@ -248,6 +305,7 @@ async def moderation_queue(
         .order_by(Report.created_at.asc())
         .offset((page - 1) * size)
         .limit(size)
+        .options(raiseload("*"))
     )
     rows = (await db.execute(stmt)).all()
 
@@ -371,7 +429,7 @@ class ChangeRoleRequest(BaseModel):
 
 @router.post("/admin/user/{user_id}/role")
 async def change_user_role(
-    user_id: str,
+    user_id: UUID,
     req: ChangeRoleRequest,
     admin: User = Depends(get_current_admin),
     db: AsyncSession = Depends(get_db),
@@ -379,7 +437,7 @@ async def change_user_role(
     if req.role not in ("user", "moderator", "admin"):
         raise HTTPException(400, "유효하지 않은 역할입니다.")
 
-    target = await db.get(User, UUID(user_id))
+    target = await db.get(User, user_id)
     if not target:
         raise HTTPException(404, "사용자를 찾을 수 없습니다.")
 
@@ -1,29 +1,36 @@
 """
 Points API: my points, history, leaderboard
 """
-import json as _json
+import logging
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
+from sqlalchemy.orm import raiseload
 
 from db.database import get_db
 from db.models import User, UserPoints, PointLog
-from api.deps import get_current_user
-from core.points import compute_level, next_level_info, LEVEL_THRESHOLDS
-from core.redis_cache import cache_get, cache_set
+from api.deps import get_current_user, encode_cursor, decode_cursor
+from core.points import (
+    compute_level, next_level_info, LEVEL_THRESHOLDS,
+    LEADERBOARD_KEY, LEADERBOARD_READY_KEY, NICKNAME_TTL_S, nickname_key,
+)
+from core.level_config import get_level_progress, get_level_for_points, get_all_levels
+from core.redis_cache import get_redis
 
-router = APIRouter(prefix="/api/points", tags=["points"])
+logger = logging.getLogger(__name__)
 
+router = APIRouter(prefix="/api/points", tags=["points"], default_response_class=ORJSONResponse)
 
-@router.get("/me")
-async def get_my_points(
-    user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    stmt = select(UserPoints).where(UserPoints.user_id == user.id)
-    result = await db.execute(stmt)
-    up = result.scalar_one_or_none()
 
+async def _get_user_points(db: AsyncSession, user_id) -> UserPoints | None:
+    stmt = select(UserPoints).where(UserPoints.user_id == user_id)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+def _points_payload(up: UserPoints | None) -> dict:
     if not up:
         return {
             "total_points": 0,
@@ -45,67 +52,144 @@ async def get_my_points(
     }
 
 
+def _level_info_payload(up: UserPoints | None) -> dict:
+    total_points = up.total_points if up else 0
+    current_level = get_level_for_points(total_points)
+    return {
+        "current": get_level_progress(total_points, current_level),
+        "all_levels": get_all_levels(),
+    }
+
+
+@router.get("/me")
+async def get_my_points(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    return _points_payload(await _get_user_points(db, user.id))
+
+
+@router.get("/summary")
+async def get_points_summary(
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """/me and /level-info in one response, from a single UserPoints lookup."""
+    up = await _get_user_points(db, user.id)
+    return {"me": _points_payload(up), "level_info": _level_info_payload(up)}
+
+
 @router.get("/history")
 async def get_point_history(
-    page: int = Query(1, ge=1),
+    cursor: str | None = Query(None),
     size: int = Query(20, ge=1, le=50),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    """Keyset-paginated point log. Pass the returned `next_cursor` to fetch the next page."""
     stmt = (
         select(PointLog)
         .where(PointLog.user_id == user.id)
-        .order_by(PointLog.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+        .order_by(PointLog.created_at.desc(), PointLog.id.desc())
+        .limit(size + 1)
+        .options(raiseload("*"))
     )
+    if cursor:
+        c_ts, c_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(PointLog.created_at, PointLog.id) < (c_ts, c_id))
     result = await db.execute(stmt)
     logs = result.scalars().all()
 
-    return [
-        {
-            "id": str(log.id),
-            "action": log.action,
-            "points": log.points,
-            "description": log.description,
-            "created_at": str(log.created_at),
-        }
-        for log in logs
-    ]
+    next_cursor = None
+    if len(logs) > size:
+        logs = logs[:size]
+        next_cursor = encode_cursor(logs[-1].created_at, logs[-1].id)
 
+    return ORJSONResponse({
+        "items": [
+            {
+                "id": log.id,
+                "action": log.action,
+                "points": log.points,
+                "description": log.description,
+                "created_at": log.created_at,
+            }
+            for log in logs
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+LEADERBOARD_SIZE = 20
+
+
+def _leaderboard_entry(rank: int, user_id, nickname, total_points: int) -> dict:
+    level_num, level_name = compute_level(total_points)
+    return {
+        "rank": rank,
+        "user_id": user_id,
+        "nickname": nickname,
+        "total_points": total_points,
+        "level": level_num,
+        "level_name": level_name,
+    }
 
-@router.get("/leaderboard")
-async def get_leaderboard(
-    db: AsyncSession = Depends(get_db),
-):
-    """Leaderboard cached for 10 minutes."""
-    cached = await cache_get("points:leaderboard")
-    if cached:
-        return _json.loads(cached)
 
+async def _leaderboard_from_db(db: AsyncSession) -> list[dict]:
     stmt = (
-        select(UserPoints, User.nickname)
+        select(UserPoints.user_id, UserPoints.total_points, User.nickname)
         .join(User, UserPoints.user_id == User.id)
         .order_by(UserPoints.total_points.desc())
-        .limit(20)
+        .limit(LEADERBOARD_SIZE)
     )
-    result = await db.execute(stmt)
-    rows = result.all()
+    rows = (await db.execute(stmt)).all()
+    return [
+        _leaderboard_entry(rank, user_id, nickname, total_points or 0)
+        for rank, (user_id, total_points, nickname) in enumerate(rows, 1)
+    ]
 
-    leaderboard = []
-    for rank, (up, nickname) in enumerate(rows, 1):
-        level_num, level_name = compute_level(up.total_points or 0)
-        leaderboard.append({
-            "rank": rank,
-            "user_id": str(up.user_id),
-            "nickname": nickname,
-            "total_points": up.total_points or 0,
-            "level": level_num,
-            "level_name": level_name,
-        })
 
-    await cache_set("points:leaderboard", _json.dumps(leaderboard), ttl=600)
-    return leaderboard
+@router.get("/leaderboard")
+async def get_leaderboard(
+    db: AsyncSession = Depends(get_db),
+):
+    """Top users by points, served from the Redis leaderboard ZSET."""
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.exists(LEADERBOARD_READY_KEY)
+            pipe.zrevrange(LEADERBOARD_KEY, 0, LEADERBOARD_SIZE - 1, withscores=True)
+            ready, entries = await pipe.execute()
+        # Until the beat task has (re)built the set, or after it was evicted,
+        # serve the SQL top-N rather than rebuilding on the request path.
+        if not ready or not entries:
+            return ORJSONResponse(await _leaderboard_from_db(db))
+
+        user_ids = [uid for uid, _ in entries]
+        nicknames = dict(zip(user_ids, await r.mget([nickname_key(uid) for uid in user_ids]))) if user_ids else {}
+        missing = [uid for uid, nick in nicknames.items() if nick is None]
+        if missing:
+            rows = (await db.execute(
+                select(User.id, User.nickname).where(User.id.in_([UUID(uid) for uid in missing]))
+            )).all()
+            async with r.pipeline(transaction=False) as pipe:
+                for user_id, nickname in rows:
+                    nicknames[str(user_id)] = nickname
+                    pipe.set(nickname_key(user_id), nickname, ex=NICKNAME_TTL_S)
+                # Members without a user row belong to deleted accounts.
+                gone = [uid for uid in missing if nicknames.get(uid) is None]
+                if gone:
+                    pipe.zrem(LEADERBOARD_KEY, *gone)
+                    entries = [(uid, score) for uid, score in entries if uid not in gone]
+                await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Redis leaderboard unavailable, falling back to SQL: {e}")
+        return ORJSONResponse(await _leaderboard_from_db(db))
+
+    return ORJSONResponse([
+        _leaderboard_entry(rank, uid, nicknames.get(uid), int(score))
+        for rank, (uid, score) in enumerate(entries, 1)
+    ])
 
 
 @router.get("/level-info")
@@ -117,17 +201,4 @@ async def get_level_info(
     Returns detailed level info including progress to next level,
     color, perks, and the full level config table.
     """
-    from core.level_config import get_level_progress, get_level_for_points, get_all_levels
-
-    stmt = select(UserPoints).where(UserPoints.user_id == user.id)
-    up = (await db.execute(stmt)).scalar_one_or_none()
-
-    total_points = up.total_points if up else 0
-    current_level = get_level_for_points(total_points)
-    progress = get_level_progress(total_points, current_level)
-    all_levels = get_all_levels()
-
-    return {
-        "current": progress,
-        "all_levels": all_levels,
-    }
+    return _level_info_payload(await _get_user_points(db, user.id))
@@ -1,13 +1,25 @@
 """
 Community Posts API: CRUD, like, bookmark, copy strategy, profiles, trending
 """
-import json as _json
+import asyncio
+import hashlib
+import logging
 import math
+import re
 from datetime import datetime, timedelta, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from typing import Annotated, Literal
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, PlainSerializer, WithJsonSchema
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update, delete
+from sqlalchemy import (
+    select, insert, func, update, delete, tuple_, exists, literal, true, table, column,
+    bindparam, case, cast, extract, String, union_all,
+)
+from sqlalchemy.dialects.postgresql import array as pg_array, insert as pg_insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
 from uuid import UUID
 
 from db.database import get_db
@@ -15,14 +27,35 @@ from db.models import (
     User, Post, Comment, Like, Bookmark, Strategy, Bot, Badge, UserPoints,
     Reaction, Follow, SubCommunityMember,
 )
-from api.deps import get_current_user, get_current_user_optional
+from api.deps import (
+    get_current_user, get_current_user_optional, encode_keyset_cursor, decode_keyset_cursor,
+)
 from api.notifications import create_notification
-from core.points import compute_level
+from api.batch import batch_liked_post_ids, batch_bookmarked_post_ids
+from core.points import award_points, compute_level, next_level_info
+from core.author_info import get_author_infos
 from core.sanitizer import sanitize_text, sanitize_content, sanitize_markdown
-from core.redis_cache import cache_get, cache_set, cache_delete
+from core.redis_cache import (
+    get_redis, cache_get, cache_set, cache_delete, cache_get_bytes, cache_set_bytes,
+)
+from core.view_counter import record_view, pending_views
 from middleware.rate_limit import rate_limit
 
-router = APIRouter(prefix="/api/posts", tags=["community"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/posts", tags=["community"], default_response_class=ORJSONResponse)
+
+# Post/comment timestamps as ISO 8601 with a numeric offset, the same text
+# orjson writes for the ORJSONResponse and cached list payloads.
+Timestamp = Annotated[
+    datetime,
+    PlainSerializer(datetime.isoformat, return_type=str, when_used="json"),
+    WithJsonSchema({"type": "string", "format": "date-time"}),
+]
+
+POST_CATEGORIES = frozenset({"strategy", "profit", "question", "free", "chart", "news", "humor"})
+# content_format -> sanitizer; unknown formats are stored as plain.
+CONTENT_SANITIZERS = {"plain": sanitize_content, "markdown": sanitize_markdown}
 
 
 class PostCreateRequest(BaseModel):
@@ -30,8 +63,8 @@ class PostCreateRequest(BaseModel):
     title: str
     content: str
     content_format: str = "plain"  # plain, markdown
-    strategy_id: str | None = None
-    sub_community_id: str | None = None
+    strategy_id: UUID | None = None
+    sub_community_id: UUID | None = None
 
 
 class PostUpdateRequest(BaseModel):
@@ -41,11 +74,11 @@ class PostUpdateRequest(BaseModel):
 
 class CommentCreateRequest(BaseModel):
     content: str
-    parent_id: str | None = None
+    parent_id: UUID | None = None
 
 
 class AuthorInfo(BaseModel):
-    id: str
+    id: UUID
     nickname: str
     plan: str = "community"
     level: int = 1
@@ -53,13 +86,14 @@ class AuthorInfo(BaseModel):
 
 
 class CommentResponse(BaseModel):
-    id: str
+    id: UUID
     author: AuthorInfo
     content: str
     like_count: int
     is_liked: bool = False
-    parent_id: str | None
-    created_at: str
+    parent_id: UUID | None
+    depth: int = 0
+    created_at: Timestamp
 
 
 class PostResponse(BaseModel):
@@ -78,12 +112,12 @@ class PostResponse(BaseModel):
     is_liked: bool = False
     is_bookmarked: bool = False
     is_pinned: bool = False
-    created_at: str
-    updated_at: str
+    created_at: Timestamp
+    updated_at: Timestamp
 
 
 class PostListItem(BaseModel):
-    id: str
+    id: UUID
     author: AuthorInfo
     category: str
     title: str
@@ -95,7 +129,15 @@ class PostListItem(BaseModel):
     has_strategy: bool
     verified_profit_pct: float | None = None
     is_pinned: bool = False
-    created_at: str
+    is_liked: bool = False
+    is_bookmarked: bool = False
+    created_at: Timestamp
+
+
+class PostListPage(BaseModel):
+    items: list[PostListItem]
+    next_cursor: str | None = None
+    has_more: bool = False
 
 
 class BadgeInfo(BaseModel):
@@ -125,7 +167,7 @@ class UserProfileResponse(BaseModel):
 
 
 class HotPostItem(BaseModel):
-    id: str
+    id: UUID
     author: AuthorInfo
     category: str
     title: str
@@ -135,11 +177,11 @@ class HotPostItem(BaseModel):
     has_strategy: bool
     verified_profit_pct: float | None = None
     velocity_score: float
-    created_at: str
+    created_at: Timestamp
 
 
 class TrendingPostItem(BaseModel):
-    id: str
+    id: UUID
     author: AuthorInfo
     category: str
     title: str
@@ -149,14 +191,14 @@ class TrendingPostItem(BaseModel):
     has_strategy: bool
     verified_profit_pct: float | None = None
     engagement_score: float
-    created_at: str
+    created_at: Timestamp
 
 
 class StrategyRankingItem(BaseModel):
-    post_id: str
+    post_id: UUID
     title: str
     author: str
-    author_id: str
+    author_id: UUID
     verified_profit: dict | None
     like_count: int
     comment_count: int
@@ -165,54 +207,65 @@ class StrategyRankingItem(BaseModel):
     author_total_bot_profit: float | None = None
 
 
+class ReactionCountItem(BaseModel):
+    emoji: str
+    count: int
+    reacted: bool = False
+
+
 # ─── Posts CRUD ──────────────────────────────────────────────────────────────
 
 @router.post("", response_model=PostResponse)
 async def create_post(
     req: PostCreateRequest,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if req.category not in ("strategy", "profit", "question", "free", "chart", "news", "humor"):
+    if req.category not in POST_CATEGORIES:
         raise HTTPException(400, "유효하지 않은 카테고리입니다.")
 
     verified_profit = None
-    strategy_name = None
-
-    # If profit post, auto-verify from bot data
-    if req.category == "profit" and req.strategy_id:
-        stmt = select(Strategy).where(Strategy.id == UUID(req.strategy_id), Strategy.user_id == user.id)
-        result = await db.execute(stmt)
-        strategy = result.scalar_one_or_none()
-        if strategy:
-            strategy_name = strategy.name
-            if strategy.backtest_result:
+    live_row = None
+    if req.strategy_id and req.category in ("profit", "strategy"):
+        # Backtest result (own strategies only) and the user's live-bot totals
+        # for the strategy in one round trip.
+        stmt = (
+            select(
+                case((Strategy.user_id == user.id, Strategy.backtest_result)).label("backtest_result"),
+                func.sum(Bot.total_profit),
+                func.sum(Bot.total_trades),
+                func.sum(Bot.win_trades),
+            )
+            .select_from(Strategy)
+            .outerjoin(Bot, (Bot.strategy_id == Strategy.id) & (Bot.user_id == user.id))
+            .where(Strategy.id == req.strategy_id)
+            .group_by(Strategy.id)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        if row:
+            backtest_result, live_row = row[0], row[1:]
+            # If profit post, auto-verify from the strategy's backtest
+            if req.category == "profit" and backtest_result:
                 verified_profit = {
-                    "total_return_pct": strategy.backtest_result.get("total_return_pct"),
-                    "win_rate": strategy.backtest_result.get("win_rate"),
-                    "max_drawdown_pct": strategy.backtest_result.get("max_drawdown_pct"),
-                    "total_trades": strategy.backtest_result.get("total_trades"),
+                    "total_return_pct": backtest_result.get("total_return_pct"),
+                    "win_rate": backtest_result.get("win_rate"),
+                    "max_drawdown_pct": backtest_result.get("max_drawdown_pct"),
+                    "total_trades": backtest_result.get("total_trades"),
                     "verified": True,
                 }
 
     # For strategy sharing, check real bot profit
-    if req.category in ("profit", "strategy") and req.strategy_id:
-        stmt = (
-            select(func.sum(Bot.total_profit), func.sum(Bot.total_trades), func.sum(Bot.win_trades))
-            .where(Bot.strategy_id == UUID(req.strategy_id), Bot.user_id == user.id)
-        )
-        result = await db.execute(stmt)
-        row = result.one_or_none()
-        if row and row[1] and row[1] > 0:
-            verified_profit = verified_profit or {}
-            verified_profit["live_profit_krw"] = float(row[0] or 0)
-            verified_profit["live_trades"] = int(row[1] or 0)
-            verified_profit["live_win_rate"] = round(int(row[2] or 0) / int(row[1]) * 100, 1)
-            verified_profit["verified"] = True
+    if live_row and live_row[1] and live_row[1] > 0:
+        verified_profit = verified_profit or {}
+        verified_profit["live_profit_krw"] = float(live_row[0] or 0)
+        verified_profit["live_trades"] = int(live_row[1] or 0)
+        verified_profit["live_win_rate"] = round(int(live_row[2] or 0) / int(live_row[1]) * 100, 1)
+        verified_profit["verified"] = True
 
     # Validate content_format
-    c_format = req.content_format if req.content_format in ("plain", "markdown") else "plain"
-    sanitized_content = sanitize_markdown(req.content) if c_format == "markdown" else sanitize_content(req.content)
+    c_format = req.content_format if req.content_format in CONTENT_SANITIZERS else "plain"
+    sanitized_content = CONTENT_SANITIZERS[c_format](req.content)
 
     post = Post(
         user_id=user.id,
@@ -220,15 +273,14 @@ async def create_post(
         title=sanitize_text(req.title),
         content=sanitized_content,
         content_format=c_format,
-        strategy_id=UUID(req.strategy_id) if req.strategy_id else None,
-        sub_community_id=UUID(req.sub_community_id) if req.sub_community_id else None,
+        strategy_id=req.strategy_id,
+        sub_community_id=req.sub_community_id,
         verified_profit=verified_profit,
     )
     db.add(post)
 
     # Award points for posting
     try:
-        from core.points import award_points
         await award_points(db, user.id, "first_post", "첫 게시글 작성 보너스")
         await award_points(db, user.id, "post", f"게시글 작성: {req.title[:30]}")
         if req.category in ("strategy", "profit") and req.strategy_id:
@@ -244,138 +296,159 @@ async def create_post(
         pass
 
     await db.commit()
-    await db.refresh(post)
 
-    # Invalidate trending & hot cache
-    await cache_delete("posts:trending")
-    await cache_delete("posts:hot")
+    # Invalidate trending, hot & profile caches after the response is sent
+    background_tasks.add_task(cache_delete, TRENDING_CACHE_KEY)
+    background_tasks.add_task(cache_delete, HOT_CACHE_KEY)
+    background_tasks.add_task(invalidate_profile_cache, user.id)
 
-    return await _to_post_response(post, user, db, strategy_name=strategy_name)
+    post, author, pts, strategy_name, _, _ = (await _load_post_detail(db, post.id)).one()
+    return _to_post_response(post, author, pts, strategy_name)
 
 
-@router.get("", response_model=list[PostListItem])
+# sort -> (key column, cursor value parser) for keyset pagination of list_posts
+_POST_SORT_KEYS = {
+    "latest": (Post.created_at, datetime.fromisoformat),
+    "popular": (Post.like_count, int),
+    "most_commented": (Post.comment_count, int),
+}
+
+
+@router.get("", response_model=PostListPage)
 async def list_posts(
     category: str | None = None,
     sort: str = Query("latest", regex="^(latest|popular|most_commented)$"),
-    page: int = Query(1, ge=1),
+    cursor: str | None = Query(None),
     size: int = Query(20, ge=1, le=50),
+    current_user: User | None = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ):
+    """Keyset-paginated post list: pass the returned `next_cursor` to get the next page."""
+    sort_col, parse_key = _POST_SORT_KEYS[sort]
     stmt = (
-        select(Post, User.nickname, User.plan, UserPoints.total_points)
-        .join(User, Post.user_id == User.id)
-        .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
+        select(*_POST_LIST_COLUMNS)
+        .order_by(Post.is_pinned.desc(), sort_col.desc(), Post.id.desc())
+        .limit(size + 1)
     )
 
     if category:
         stmt = stmt.where(Post.category == category)
 
-    if sort == "popular":
-        stmt = stmt.order_by(Post.is_pinned.desc(), Post.like_count.desc())
-    elif sort == "most_commented":
-        stmt = stmt.order_by(Post.is_pinned.desc(), Post.comment_count.desc())
-    else:
-        stmt = stmt.order_by(Post.is_pinned.desc(), Post.created_at.desc())
+    if cursor:
+        c_pinned, c_key, c_id = decode_keyset_cursor(cursor, 3)
+        try:
+            c_values = (c_pinned == "1", parse_key(c_key), UUID(c_id))
+        except ValueError:
+            raise HTTPException(400, "유효하지 않은 커서입니다.")
+        stmt = stmt.where(tuple_(Post.is_pinned, sort_col, Post.id) < c_values)
 
-    stmt = stmt.offset((page - 1) * size).limit(size)
     result = await db.execute(stmt)
-    rows = result.all()
-
-    return [
-        PostListItem(
-            id=str(post.id),
-            author=_author(post.user_id, nickname, plan, pts),
-            category=post.category,
-            title=post.title,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            view_count=post.view_count,
-            excerpt=_excerpt(post.content),
-            thumbnail_url=_thumbnail(post.content),
-            has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            is_pinned=post.is_pinned,
-            created_at=str(post.created_at),
-        )
-        for post, nickname, plan, pts in rows
-    ]
+    rows = result.mappings().all()
+
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_keyset_cursor(int(bool(last["is_pinned"])), last[sort_col.key], last["id"])
+
+    authors = await _load_authors(db, [row["user_id"] for row in rows])
+    items = [_post_list_item(row, authors[row["user_id"]]) for row in rows]
+    await _add_pending_views(items)
+    if current_user:
+        await _mark_viewer_state(db, current_user.id, items)
+    # PostListPage only documents the schema; orjson encodes the dicts directly.
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor, "has_more": has_more})
 
 
 # ─── Trending Posts ───────────────────────────────────────────────────────────
 # NOTE: This route MUST be defined before /{post_id} to avoid FastAPI matching
 # "trending" as a post_id UUID.
 
+# Refreshed every minute by tasks.data_tasks.refresh_trending_posts; holds the
+# precomputed engagement score for posts from the last 30 days.
+_trending_mv = table(
+    "trending_posts_mv",
+    column("post_id"),
+    column("engagement_score"),
+)
+TRENDING_CACHE_KEY = "posts:trending"
+TRENDING_CACHE_TTL_S = 60
+
+
 @router.get("/trending", response_model=list[TrendingPostItem])
 async def trending_posts(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    """Returns trending posts: high engagement in the last 30 days. Falls back to all-time if empty. Cached for 5 minutes."""
+    """Returns trending posts: high engagement in the last 30 days. Falls back to all-time if empty. Cached for 1 minute."""
     # Check cache first
-    cached = await cache_get("posts:trending")
-    if cached:
-        return _json.loads(cached)
-
-    # Engagement score: like_count * 2 + comment_count * 3 + view_count
-    engagement_score = (
-        Post.like_count * 2 + Post.comment_count * 3 + Post.view_count
-    ).label("engagement_score")
-
-    def make_stmt(since=None):
-        q = (
-            select(Post, User.nickname, User.plan, engagement_score, UserPoints.total_points)
-            .join(User, Post.user_id == User.id)
-            .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
-            .order_by(engagement_score.desc())
-            .limit(10)
-        )
-        if since:
-            q = q.where(Post.created_at >= since)
-        return q
+    cached = await cache_get_bytes(TRENDING_CACHE_KEY)
+    if cached is not None:
+        return _public_json_response(request, cached, TRENDING_CACHE_TTL_S, "HIT")
+
+    columns = (
+        Post.id, Post.user_id, Post.category, Post.title,
+        Post.like_count, Post.comment_count, Post.view_count, Post.strategy_id,
+        Post.verified_profit_pct, Post.created_at,
+    )
 
-    # Try 30 days first, fall back to all-time
-    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
-    result = await db.execute(make_stmt(since=thirty_days_ago))
-    rows = result.all()
+    stmt = (
+        select(*columns, _trending_mv.c.engagement_score)
+        .select_from(_trending_mv)
+        .join(Post, Post.id == _trending_mv.c.post_id)
+        .order_by(_trending_mv.c.engagement_score.desc())
+        .limit(10)
+    )
+    rows = (await db.execute(stmt)).all()
 
     if not rows:
-        result = await db.execute(make_stmt())
-        rows = result.all()
+        # Nothing in the 30-day window: rank all-time from the live table. Only
+        # reached on an empty window, so a top-10 sort beats keeping an index
+        # on a score that changes with every view flush.
+        stmt = (
+            select(*columns, Post.engagement_score)
+            .order_by(Post.engagement_score.desc(), Post.id.desc())
+            .limit(10)
+        )
+        rows = (await db.execute(stmt)).all()
 
+    authors = await _load_authors(db, [row.user_id for row in rows])
     items = [
-        TrendingPostItem(
-            id=str(post.id),
-            author=_author(post.user_id, nickname, plan, pts),
-            category=post.category,
-            title=post.title,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            view_count=post.view_count,
-            has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            engagement_score=float(score),
-            created_at=str(post.created_at),
-        )
-        for post, nickname, plan, score, pts in rows
+        {
+            "id": row.id,
+            "author": authors[row.user_id],
+            "category": row.category,
+            "title": row.title,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "view_count": row.view_count,
+            "has_strategy": row.strategy_id is not None,
+            "verified_profit_pct": row.verified_profit_pct,
+            "engagement_score": float(row.engagement_score),
+            "created_at": row.created_at,
+        }
+        for row in rows
     ]
 
-    # Cache for 5 minutes
-    await cache_set("posts:trending", _json.dumps([i.model_dump() for i in items]), ttl=300)
+    # Cached as the encoded body so hits are served without decoding/re-encoding.
+    payload = orjson.dumps(items)
+    await cache_set_bytes(TRENDING_CACHE_KEY, payload, ttl=TRENDING_CACHE_TTL_S)
 
-    return items
+    return _public_json_response(request, payload, TRENDING_CACHE_TTL_S, "MISS")
 
 
 # ─── Hot Posts (velocity-based) ──────────────────────────────────────────────
 # NOTE: This route MUST be defined before /{post_id} to avoid FastAPI matching
 # "hot" as a post_id UUID.
 
+HOT_CACHE_KEY = "posts:hot"
+HOT_CACHE_TTL_S = 300
+
+
 @router.get("/hot", response_model=list[HotPostItem])
 async def get_hot_posts(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -385,201 +458,193 @@ async def get_hot_posts(
     Cached for 5 minutes.
     """
     # Check cache first
-    cached = await cache_get("posts:hot")
-    if cached:
-        return _json.loads(cached)
+    cached = await cache_get_bytes(HOT_CACHE_KEY)
+    if cached is not None:
+        return _public_json_response(request, cached, HOT_CACHE_TTL_S, "HIT")
 
     forty_eight_hours_ago = datetime.now(timezone.utc) - timedelta(hours=48)
 
-    stmt = (
-        select(Post, User.nickname, User.plan, UserPoints.total_points)
-        .join(User, Post.user_id == User.id)
-        .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
-        .where(Post.created_at >= forty_eight_hours_ago)
-        .order_by(Post.created_at.desc())
-        .limit(200)
+    # Scored in SQL so only the top 20 rows come back.
+    hours_since = func.greatest(extract("epoch", func.now() - Post.created_at) / 3600.0, 1.0)
+    raw_engagement = (
+        func.coalesce(Post.like_count, 0) * 2
+        + func.coalesce(Post.comment_count, 0) * 3
+        + func.coalesce(Post.view_count, 0) * 0.1
     )
-    result = await db.execute(stmt)
-    rows = result.all()
+    # Velocity = engagement per hour, log-dampened for posts older than 12 hours
+    velocity = (raw_engagement / hours_since) * case(
+        (hours_since > 12, math.log(12) / func.ln(hours_since)),
+        else_=1.0,
+    )
+    velocity = velocity.label("velocity_score")
 
-    now = datetime.now(timezone.utc)
-    scored_items = []
-    for post, nickname, plan, pts in rows:
-        hours_since = max((now - post.created_at).total_seconds() / 3600, 1)
-        raw_engagement = (
-            (post.like_count or 0) * 2
-            + (post.comment_count or 0) * 3
-            + (post.view_count or 0) * 0.1
+    stmt = (
+        select(
+            Post.id, Post.user_id, Post.category, Post.title,
+            Post.like_count, Post.comment_count, Post.view_count, Post.strategy_id,
+            Post.verified_profit_pct, Post.created_at, velocity,
         )
-        # Velocity = engagement per hour
-        velocity = raw_engagement / hours_since
-        # Log dampening for posts older than 12 hours
-        if hours_since > 12:
-            dampening = math.log2(12) / math.log2(hours_since)
-            velocity *= dampening
-
-        scored_items.append((velocity, post, nickname, plan, pts))
-
-    # Sort by velocity score descending
-    scored_items.sort(key=lambda x: x[0], reverse=True)
-    top_items = scored_items[:20]
+        .where(Post.created_at >= forty_eight_hours_ago)
+        .order_by(velocity.desc())
+        .limit(20)
+    )
+    rows = (await db.execute(stmt)).all()
 
+    authors = await _load_authors(db, [row.user_id for row in rows])
     items = [
-        HotPostItem(
-            id=str(post.id),
-            author=_author(post.user_id, nickname, plan, pts),
-            category=post.category,
-            title=post.title,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            view_count=post.view_count,
-            has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            velocity_score=round(velocity_score, 4),
-            created_at=str(post.created_at),
-        )
-        for velocity_score, post, nickname, plan, pts in top_items
+        {
+            "id": row.id,
+            "author": authors[row.user_id],
+            "category": row.category,
+            "title": row.title,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "view_count": row.view_count,
+            "has_strategy": row.strategy_id is not None,
+            "verified_profit_pct": row.verified_profit_pct,
+            "velocity_score": round(float(row.velocity_score), 4),
+            "created_at": row.created_at,
+        }
+        for row in rows
     ]
 
-    # Cache for 5 minutes
-    await cache_set("posts:hot", _json.dumps([i.model_dump() for i in items]), ttl=300)
+    # Cache the encoded body for 5 minutes
+    payload = orjson.dumps(items)
+    await cache_set_bytes(HOT_CACHE_KEY, payload, ttl=HOT_CACHE_TTL_S)
 
-    return items
+    return _public_json_response(request, payload, HOT_CACHE_TTL_S, "MISS")
 
 
 # ─── User Profile ────────────────────────────────────────────────────────────
 # NOTE: This route MUST be defined before /{post_id} to avoid FastAPI matching
 # "user" as a post_id UUID.
 
+PROFILE_CACHE_KEY = "posts:profile:{}"
+PROFILE_CACHE_TTL_S = 30
+
+
+async def invalidate_profile_cache(user_id) -> None:
+    """Drop a user's cached profile after a write that changes its counters."""
+    await cache_delete(PROFILE_CACHE_KEY.format(user_id))
+
+
+async def _profile_recent_posts_and_badges(db: AsyncSession, uid: UUID) -> tuple[list, list]:
+    recent_stmt = (
+        select(*_POST_LIST_COLUMNS, User.nickname, User.plan)
+        .join(User, Post.user_id == User.id)
+        .where(Post.user_id == uid)
+        .order_by(Post.created_at.desc())
+        .limit(5)
+    )
+    recent_rows = (await db.execute(recent_stmt)).mappings().all()
+    badge_rows = (await db.execute(
+        select(Badge.type, Badge.label).where(Badge.user_id == uid)
+    )).all()
+    return recent_rows, badge_rows
+
+
 @router.get("/user/{user_id}/profile", response_model=UserProfileResponse)
 async def get_user_profile(
-    user_id: str,
+    user_id: UUID,
     current_user: User | None = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ):
-    """Returns a user's public profile with community stats."""
-    uid = UUID(user_id)
-
-    # Fetch user
-    target_user = await db.get(User, uid)
-    if not target_user:
-        raise HTTPException(404, "사용자를 찾을 수 없습니다.")
-
-    # Post count
-    stmt = select(func.count()).select_from(Post).where(Post.user_id == uid)
-    post_count = (await db.execute(stmt)).scalar() or 0
-
-    # Total likes received (sum of like_count on all user's posts)
-    stmt = select(func.coalesce(func.sum(Post.like_count), 0)).where(Post.user_id == uid)
-    total_likes = (await db.execute(stmt)).scalar() or 0
-
-    # Total comments on user's posts
-    stmt = select(func.coalesce(func.sum(Post.comment_count), 0)).where(Post.user_id == uid)
-    total_comments = (await db.execute(stmt)).scalar() or 0
+    """Returns a user's public profile with community stats. Cached for 30 seconds (except is_following)."""
+    cache_key = PROFILE_CACHE_KEY.format(user_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        is_following = False
+        if current_user:
+            is_following = await db.scalar(
+                select(exists().where(Follow.follower_id == current_user.id, Follow.following_id == user_id))
+            )
+        return UserProfileResponse(**cached, is_following=bool(is_following))
 
-    # Shared strategies count (public strategies)
-    stmt = (
-        select(func.count())
-        .select_from(Strategy)
-        .where(Strategy.user_id == uid, Strategy.is_public == True)
+    # User row plus every profile counter in one round trip.
+    post_stats = (
+        select(
+            func.count().label("post_count"),
+            func.coalesce(func.sum(Post.like_count), 0).label("total_likes"),
+            func.coalesce(func.sum(Post.comment_count), 0).label("total_comments"),
+        )
+        .where(Post.user_id == user_id)
+        .subquery()
     )
-    shared_strategies_count = (await db.execute(stmt)).scalar() or 0
-
-    # Total copy count of their strategies
-    stmt = (
-        select(func.coalesce(func.sum(Strategy.copy_count), 0))
-        .where(Strategy.user_id == uid)
+    strategy_stats = (
+        select(
+            func.count().filter(Strategy.is_public == True).label("shared_strategies_count"),
+            func.coalesce(func.sum(Strategy.copy_count), 0).label("total_copy_count"),
+        )
+        .where(Strategy.user_id == user_id)
+        .subquery()
+    )
+    following_count_sq = (
+        select(func.count()).select_from(Follow).where(Follow.follower_id == user_id).scalar_subquery()
     )
-    total_copy_count = (await db.execute(stmt)).scalar() or 0
+    total_points_sq = select(UserPoints.total_points).where(UserPoints.user_id == user_id).scalar_subquery()
+    if current_user:
+        is_following_expr = exists().where(Follow.follower_id == current_user.id, Follow.following_id == user_id)
+    else:
+        is_following_expr = literal(False)
 
-    # Recent posts (last 5)
     stmt = (
-        select(Post, User.nickname, User.plan)
-        .join(User, Post.user_id == User.id)
-        .where(Post.user_id == uid)
-        .order_by(Post.created_at.desc())
-        .limit(5)
+        select(
+            User.id, User.nickname, User.plan, User.created_at, User.follower_count,
+            post_stats.c.post_count,
+            post_stats.c.total_likes,
+            post_stats.c.total_comments,
+            strategy_stats.c.shared_strategies_count,
+            strategy_stats.c.total_copy_count,
+            following_count_sq.label("following_count"),
+            total_points_sq.label("total_points"),
+            is_following_expr.label("is_following"),
+        )
+        .select_from(User)
+        .join(post_stats, true())
+        .join(strategy_stats, true())
+        .where(User.id == user_id)
     )
-    result = await db.execute(stmt)
-    recent_rows = result.all()
+    row = (await db.execute(stmt)).one_or_none()
+    if not row:
+        raise HTTPException(404, "사용자를 찾을 수 없습니다.")
+    # Same session as the stats query: a second pooled connection per request
+    # costs more under load than the overlap saves, and the result is cached.
+    recent_rows, badge_rows = await _profile_recent_posts_and_badges(db, user_id)
 
     recent_posts = [
-        PostListItem(
-            id=str(post.id),
-            author=AuthorInfo(id=str(post.user_id), nickname=nickname, plan=plan),
-            category=post.category,
-            title=post.title,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            view_count=post.view_count,
-            excerpt=_excerpt(post.content),
-            thumbnail_url=_thumbnail(post.content),
-            has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            is_pinned=post.is_pinned,
-            created_at=str(post.created_at),
-        )
-        for post, nickname, plan in recent_rows
+        PostListItem(**_post_list_item(row, AuthorInfo(id=row["user_id"], nickname=row["nickname"], plan=row["plan"])))
+        for row in recent_rows
     ]
-
-    # Badges
-    from db.models import Follow
-    badge_stmt = select(Badge).where(Badge.user_id == uid)
-    badge_rows = (await db.execute(badge_stmt)).scalars().all()
     badges = [BadgeInfo(type=b.type, label=b.label) for b in badge_rows]
 
-    # Follower/following counts
-    follower_count = (await db.execute(
-        select(func.count()).select_from(Follow).where(Follow.following_id == uid)
-    )).scalar() or 0
-    following_count = (await db.execute(
-        select(func.count()).select_from(Follow).where(Follow.follower_id == uid)
-    )).scalar() or 0
-
-    # Is current user following this user?
-    is_following = False
-    if current_user:
-        f_exists = (await db.execute(
-            select(Follow).where(Follow.follower_id == current_user.id, Follow.following_id == uid)
-        )).scalar_one_or_none()
-        is_following = f_exists is not None
-
     # Level & Points
-    up = (await db.execute(
-        select(UserPoints).where(UserPoints.user_id == uid)
-    )).scalar_one_or_none()
-    tp = up.total_points if up else 0
+    tp = row.total_points or 0
     lv, lv_name = compute_level(tp)
-    from core.points import next_level_info
     nli = next_level_info(tp)
 
-    return UserProfileResponse(
-        id=str(target_user.id),
-        nickname=target_user.nickname,
-        plan=target_user.plan or "community",
-        joined_at=str(target_user.created_at),
+    profile = UserProfileResponse(
+        id=str(row.id),
+        nickname=row.nickname,
+        plan=row.plan or "community",
+        joined_at=str(row.created_at),
         level=lv,
         level_name=lv_name,
         total_points=tp,
         next_level_name=nli.get("next_level_name"),
         next_threshold=nli.get("next_threshold"),
-        post_count=post_count,
-        total_likes_received=total_likes,
-        total_comments=total_comments,
-        shared_strategies_count=shared_strategies_count,
-        total_copy_count=total_copy_count,
+        post_count=row.post_count,
+        total_likes_received=row.total_likes,
+        total_comments=row.total_comments,
+        shared_strategies_count=row.shared_strategies_count,
+        total_copy_count=row.total_copy_count,
         badges=badges,
-        follower_count=follower_count,
-        following_count=following_count,
-        is_following=is_following,
+        follower_count=row.follower_count or 0,
+        following_count=row.following_count,
+        is_following=bool(row.is_following),
         recent_posts=recent_posts,
     )
+    await cache_set(cache_key, profile.model_dump(exclude={"is_following"}), ttl=PROFILE_CACHE_TTL_S)
+    return profile
 
 
 # ─── Ranking (improved) ──────────────────────────────────────────────────────
@@ -596,13 +661,33 @@ async def strategy_ranking(
       verified_profit_pct * 0.4 + like_count * 0.3 + copy_count * 0.3
     Includes period filter (week/month/all) and author's total bot profit.
     """
+    # Author bot profit as a correlated subquery (served by ix_bots_user_id), so
+    # it's computed in the same round trip for just the returned rows.
+    author_bot_profit_sq = (
+        select(func.coalesce(func.sum(Bot.total_profit), 0))
+        .where(Bot.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+        .label("author_bot_profit")
+    )
+
+    # Score in SQL so ORDER BY ... LIMIT 20 returns the actual top 20.
+    # Non-numeric total_return_pct values are NULL in the generated column and count as 0.
+    score_expr = (
+        func.coalesce(Post.verified_profit_pct, 0.0) * 0.4
+        + func.coalesce(Post.like_count, 0) * 0.3
+        + func.coalesce(Strategy.copy_count, 0) * 0.3
+    ).label("ranking_score")
+
     # Build the base query joining Post -> User and optionally Strategy
     stmt = (
         select(
-            Post,
+            Post.id, Post.title, Post.verified_profit, Post.like_count, Post.comment_count,
             User.nickname,
             User.id.label("author_id"),
             Strategy.copy_count,
+            author_bot_profit_sq,
+            score_expr,
         )
         .join(User, Post.user_id == User.id)
         .outerjoin(Strategy, Post.strategy_id == Strategy.id)
@@ -619,58 +704,38 @@ async def strategy_ranking(
     elif period == "month":
         stmt = stmt.where(Post.created_at >= now - timedelta(days=30))
 
-    stmt = stmt.limit(20)
+    stmt = stmt.order_by(score_expr.desc(), Post.id.desc()).limit(20)
     result = await db.execute(stmt)
     rows = result.all()
 
-    # Batch-fetch author bot profits in one query (fix N+1)
-    author_ids = list({row.author_id for _, _, author_id, _ in rows})
-    author_profits: dict[str, float] = {}
-    if author_ids:
-        profit_stmt = (
-            select(Bot.user_id, func.coalesce(func.sum(Bot.total_profit), 0))
-            .where(Bot.user_id.in_(author_ids))
-            .group_by(Bot.user_id)
-        )
-        profit_rows = (await db.execute(profit_stmt)).all()
-        author_profits = {str(uid): float(p) for uid, p in profit_rows}
-
-    ranked = []
-    for post, nickname, author_id, copy_count in rows:
-        verified_profit_pct = 0.0
-        if post.verified_profit:
-            verified_profit_pct = float(post.verified_profit.get("total_return_pct") or 0)
-
-        copy_cnt = int(copy_count or 0)
-        ranking_score = (
-            verified_profit_pct * 0.4
-            + post.like_count * 0.3
-            + copy_cnt * 0.3
-        )
-        author_bot_profit = author_profits.get(str(author_id), 0.0)
-
-        ranked.append(StrategyRankingItem(
-            post_id=str(post.id),
-            title=post.title,
-            author=nickname,
-            author_id=str(author_id),
-            verified_profit=post.verified_profit,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            copy_count=copy_cnt,
-            ranking_score=round(ranking_score, 2),
-            author_total_bot_profit=author_bot_profit if author_bot_profit else None,
-        ))
-
-    ranked.sort(key=lambda x: x.ranking_score, reverse=True)
-    return ranked
+    # Rows arrive already ranked; StrategyRankingItem only documents the schema.
+    return ORJSONResponse([
+        {
+            "post_id": row.id,
+            "title": row.title,
+            "author": row.nickname,
+            "author_id": row.author_id,
+            "verified_profit": row.verified_profit,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "copy_count": int(row.copy_count or 0),
+            "ranking_score": round(float(row.ranking_score), 2),
+            "author_total_bot_profit": float(row.author_bot_profit) if row.author_bot_profit else None,
+        }
+        for row in rows
+    ])
 
 
 # ─── Sitemap ────────────────────────────────────────────────────────────────
 # NOTE: Must be defined before /{post_id}
 
+SITEMAP_URLS_CACHE_KEY = "posts:sitemap:urls"
+SITEMAP_URLS_CACHE_TTL_S = 600
+
+
 @router.get("/sitemap")
 async def posts_sitemap(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Public endpoint for sitemap: returns recent 1000 posts (id + updated_at)."""
@@ -680,37 +745,38 @@ async def posts_sitemap(
         .limit(1000)
     )
     rows = (await db.execute(stmt)).all()
-    return [
-        {"id": str(pid), "updated_at": str(updated)}
+    # Raw UUID/datetime values: orjson formats them natively.
+    payload = orjson.dumps([
+        {"id": pid, "updated_at": updated}
         for pid, updated in rows
-    ]
+    ])
+    return _public_json_response(request, payload, SITEMAP_URLS_CACHE_TTL_S)
 
 
 @router.get("/sitemap/urls")
 async def sitemap_urls(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Extended sitemap: returns post URLs + user profile URLs + series URLs.
-    Used by the frontend sitemap generator.
+    Used by the frontend sitemap generator. Cached for 10 minutes.
     """
     from db.models import PostSeries
 
+    cached = await cache_get_bytes(SITEMAP_URLS_CACHE_KEY)
+    if cached is not None:
+        return _public_json_response(request, cached, SITEMAP_URLS_CACHE_TTL_S, "HIT")
+
     # Post URLs (recent 1000)
-    post_stmt = (
-        select(Post.id, Post.updated_at)
+    post_urls = (
+        select(literal("/community/").concat(cast(Post.id, String)), Post.updated_at, literal("post"))
         .order_by(Post.updated_at.desc())
         .limit(1000)
     )
-    post_rows = (await db.execute(post_stmt)).all()
-    post_urls = [
-        {"loc": f"/community/{str(pid)}", "lastmod": str(updated), "type": "post"}
-        for pid, updated in post_rows
-    ]
-
     # User profile URLs (active users with at least 1 post)
-    user_stmt = (
-        select(User.nickname, User.updated_at)
+    user_urls = (
+        select(literal("/user/").concat(User.nickname), User.updated_at, literal("profile"))
         .where(User.is_active == True)
         .where(
             User.id.in_(
@@ -720,33 +786,87 @@ async def sitemap_urls(
         .order_by(User.updated_at.desc())
         .limit(500)
     )
-    user_rows = (await db.execute(user_stmt)).all()
-    user_urls = [
-        {"loc": f"/user/{nickname}", "lastmod": str(updated), "type": "profile"}
-        for nickname, updated in user_rows
-    ]
-
     # Series URLs
-    series_stmt = (
-        select(PostSeries.id, PostSeries.updated_at)
+    series_urls = (
+        select(literal("/series/").concat(cast(PostSeries.id, String)), PostSeries.updated_at, literal("series"))
         .order_by(PostSeries.updated_at.desc())
         .limit(500)
     )
-    series_rows = (await db.execute(series_stmt)).all()
-    series_urls = [
-        {"loc": f"/series/{str(sid)}", "lastmod": str(updated), "type": "series"}
-        for sid, updated in series_rows
+
+    # One round trip; each branch keeps its own ORDER BY/LIMIT.
+    rows = (await db.execute(union_all(post_urls, user_urls, series_urls))).all()
+    urls = [
+        {"loc": loc, "lastmod": updated, "type": url_type}
+        for loc, updated, url_type in rows
     ]
 
-    return {
-        "urls": post_urls + user_urls + series_urls,
-        "total": len(post_urls) + len(user_urls) + len(series_urls),
-    }
+    payload = orjson.dumps({"urls": urls, "total": len(urls)})
+    await cache_set_bytes(SITEMAP_URLS_CACHE_KEY, payload, ttl=SITEMAP_URLS_CACHE_TTL_S)
+
+    return _public_json_response(request, payload, SITEMAP_URLS_CACHE_TTL_S, "MISS")
 
 
 # ─── Personalized Feed ──────────────────────────────────────────────────────
 # NOTE: Must be defined before /{post_id}
 
+PERSONALIZED_FEED_KEY = "feed:personalized:{}"
+PERSONALIZED_FEED_TTL_S = 120
+# Ranked candidates kept per user; pages past this are empty.
+PERSONALIZED_FEED_SIZE = 500
+
+
+def _personalized_score(user_id):
+    followed_ids = select(Follow.following_id).where(Follow.follower_id == user_id)
+    joined_sub_ids = select(SubCommunityMember.sub_community_id).where(SubCommunityMember.user_id == user_id)
+    hours_old = extract("epoch", func.now() - Post.created_at) / 3600.0
+    return (
+        case((Post.user_id.in_(followed_ids), 3.0), else_=1.0)
+        * case((Post.sub_community_id.in_(joined_sub_ids), 2.0), else_=1.0)
+        * case((Post.engagement_score > 50, 1.5), else_=1.0)
+        * func.power(0.9, hours_old / 24)
+    )
+
+
+async def invalidate_personalized_feed(user_id) -> None:
+    """Drop a user's ranked feed after a follow/membership change."""
+    await cache_delete(PERSONALIZED_FEED_KEY.format(user_id))
+
+
+async def _personalized_page_ids(db: AsyncSession, user_id, start: int, stop: int) -> list[UUID] | None:
+    """
+    Post ids for one page of the user's feed, from the ranked ZSET in Redis
+    (rebuilt from SQL when missing). None if Redis is unavailable.
+    """
+    key = PERSONALIZED_FEED_KEY.format(user_id)
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.zrevrange(key, start, stop)
+            ready, ids = await pipe.execute()
+        if not ready:
+            seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+            score = _personalized_score(user_id).label("score")
+            ranked = (await db.execute(
+                select(Post.id, score)
+                .where(Post.created_at >= seven_days_ago)
+                .order_by(score.desc(), Post.id.desc())
+                .limit(PERSONALIZED_FEED_SIZE)
+            )).all()
+            if not ranked:
+                return []
+            async with r.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.zadd(key, {str(pid): float(sc) for pid, sc in ranked})
+                pipe.expire(key, PERSONALIZED_FEED_TTL_S)
+                await pipe.execute()
+            ids = [str(pid) for pid, _ in ranked[start:stop + 1]]
+        return [UUID(i) for i in ids]
+    except Exception as e:
+        logger.warning(f"Personalized feed cache failed for user {user_id}: {e}")
+        return None
+
+
 @router.get("/personalized", response_model=list[PostListItem])
 async def personalized_feed(
     page: int = Query(1, ge=1),
@@ -760,113 +880,110 @@ async def personalized_feed(
       - Joined sub-community posts: weight x2
       - Popular last 7 days: weight x1.5
       - Time decay: 0.9 per 24h
+    The ranking is cached per user for 2 minutes; pages are sliced from it.
     """
-    import math
-
-    now = datetime.now(timezone.utc)
-    seven_days_ago = now - timedelta(days=7)
-
-    # Get followed user IDs
-    follow_stmt = select(Follow.following_id).where(Follow.follower_id == user.id)
-    followed_ids = {r[0] for r in (await db.execute(follow_stmt)).all()}
-
-    # Get joined sub-community IDs
-    sub_stmt = select(SubCommunityMember.sub_community_id).where(SubCommunityMember.user_id == user.id)
-    joined_sub_ids = {r[0] for r in (await db.execute(sub_stmt)).all()}
-
-    # Fetch recent posts (wider pool)
-    stmt = (
-        select(Post, User.nickname, User.plan, UserPoints.total_points)
-        .join(User, Post.user_id == User.id)
-        .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
-        .where(Post.created_at >= seven_days_ago)
-        .order_by(Post.created_at.desc())
-        .limit(200)
-    )
-    rows = (await db.execute(stmt)).all()
+    start = (page - 1) * size
+    stmt = select(*_POST_LIST_COLUMNS)
 
-    scored_items = []
-    for post, nickname, plan, pts in rows:
-        score = 1.0
+    page_ids = await _personalized_page_ids(db, user.id, start, start + size - 1)
+    if page_ids is None:
+        # Redis unavailable: score and paginate in SQL.
+        seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+        stmt = (
+            stmt.where(Post.created_at >= seven_days_ago)
+            .order_by(_personalized_score(user.id).desc(), Post.id.desc())
+            .offset(start)
+            .limit(size)
+        )
+        rows = (await db.execute(stmt)).mappings().all()
+    elif page_ids:
+        by_id = {row["id"]: row for row in (await db.execute(stmt.where(Post.id.in_(page_ids)))).mappings()}
+        # Keep the cached ranking order; posts deleted since ranking drop out.
+        rows = [by_id[pid] for pid in page_ids if pid in by_id]
+    else:
+        rows = []
 
-        # Following bonus
-        if post.user_id in followed_ids:
-            score *= 3.0
+    authors = await _load_authors(db, [row["user_id"] for row in rows])
+    items = [_post_list_item(row, authors[row["user_id"]]) for row in rows]
+    await _add_pending_views(items)
+    await _mark_viewer_state(db, user.id, items)
+    return ORJSONResponse(items)
 
-        # Sub-community bonus
-        if post.sub_community_id and post.sub_community_id in joined_sub_ids:
-            score *= 2.0
 
-        # Engagement bonus
-        engagement = post.like_count * 2 + post.comment_count * 3 + post.view_count
-        if engagement > 50:
-            score *= 1.5
+# ─── Batch Reactions ─────────────────────────────────────────────────────────
+# NOTE: Must be defined before /{post_id}
 
-        # Time decay (0.9 per 24h)
-        hours_old = (now - post.created_at).total_seconds() / 3600
-        score *= math.pow(0.9, hours_old / 24)
+REACTIONS_BATCH_MAX_IDS = 50
 
-        scored_items.append((score, post, nickname, plan, pts))
 
-    # Sort by score descending
-    scored_items.sort(key=lambda x: x[0], reverse=True)
+@router.get("/reactions", response_model=dict[str, list[ReactionCountItem]])
+async def get_reactions_batch(
+    ids: str = Query(..., description="Comma-separated post ids"),
+    current_user: User | None = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reaction summaries for a page of posts in one query: {post_id: [ReactionCountItem]}."""
+    try:
+        post_ids = list(dict.fromkeys(UUID(pid.strip()) for pid in ids.split(",") if pid.strip()))
+    except ValueError:
+        raise HTTPException(400, "유효하지 않은 게시글 ID입니다.")
+    if len(post_ids) > REACTIONS_BATCH_MAX_IDS:
+        raise HTTPException(400, f"한 번에 최대 {REACTIONS_BATCH_MAX_IDS}개까지 조회할 수 있습니다.")
 
-    # Paginate
-    start = (page - 1) * size
-    page_items = scored_items[start:start + size]
-
-    return [
-        PostListItem(
-            id=str(post.id),
-            author=_author(post.user_id, nickname, plan, pts),
-            category=post.category,
-            title=post.title,
-            like_count=post.like_count,
-            comment_count=post.comment_count,
-            view_count=post.view_count,
-            excerpt=_excerpt(post.content),
-            thumbnail_url=_thumbnail(post.content),
-            has_strategy=post.strategy_id is not None,
-            verified_profit_pct=(
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            is_pinned=post.is_pinned,
-            created_at=str(post.created_at),
-        )
-        for _, post, nickname, plan, pts in page_items
-    ]
+    reacted = func.bool_or(Reaction.user_id == current_user.id) if current_user else literal(False)
+    stmt = (
+        select(Reaction.target_id, Reaction.emoji, func.count(), reacted)
+        .where(Reaction.target_type == "post", Reaction.target_id.in_(post_ids))
+        .group_by(Reaction.target_id, Reaction.emoji)
+    )
+    summary: dict = {pid: [] for pid in post_ids}
+    for target_id, emoji, cnt, me in (await db.execute(stmt)).all():
+        summary[target_id].append({"emoji": emoji, "count": cnt, "reacted": bool(me)})
+    # ORJSONResponse encodes with OPT_NON_STR_KEYS, so UUID keys become strings.
+    return ORJSONResponse(summary)
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
-    post_id: str,
+    post_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Post).where(Post.id == UUID(post_id))
-    result = await db.execute(stmt)
-    post = result.scalar_one_or_none()
-    if not post:
+    row = (await _load_post_detail(db, post_id, user.id)).one_or_none()
+    if not row:
         raise HTTPException(404, "게시글을 찾을 수 없습니다.")
+    post, author, pts, strategy_name, is_liked, is_bookmarked = row
 
-    # Increment view count
-    post.view_count = (post.view_count or 0) + 1
-    await db.commit()
+    # Views are buffered in Redis and flushed by tasks.data_tasks.flush_post_views;
+    # show the stored count plus what is still pending.
+    pending = await record_view(post_id)
+    if pending is not None:
+        set_committed_value(post, "view_count", (post.view_count or 0) + pending)
+    else:
+        # Redis unavailable: fall back to a direct atomic increment.
+        view_count = (await db.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(view_count=Post.view_count + 1, updated_at=Post.updated_at)
+            .returning(Post.view_count)
+        )).scalar_one_or_none()
+        if view_count is None:
+            # Deleted between the detail read and the increment.
+            raise HTTPException(404, "게시글을 찾을 수 없습니다.")
+        await db.commit()
+        set_committed_value(post, "view_count", view_count)
 
-    # Get author
-    author = await db.get(User, post.user_id)
-    return await _to_post_response(post, author, db, current_user_id=user.id)
+    return _to_post_response(post, author, pts, strategy_name, is_liked, is_bookmarked)
 
 
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
-    post_id: str,
+    post_id: UUID,
     req: PostUpdateRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Post).where(Post.id == UUID(post_id), Post.user_id == user.id)
+    stmt = select(Post).where(Post.id == post_id, Post.user_id == user.id)
     result = await db.execute(stmt)
     post = result.scalar_one_or_none()
     if not post:
@@ -875,24 +992,25 @@ async def update_post(
     if req.title is not None:
         post.title = sanitize_text(req.title)
     if req.content is not None:
-        # Use markdown sanitizer if the post was created with markdown format
-        if getattr(post, 'content_format', 'plain') == "markdown":
-            post.content = sanitize_markdown(req.content)
-        else:
-            post.content = sanitize_content(req.content)
+        # Sanitize with the format the post was created with
+        sanitize = CONTENT_SANITIZERS.get(getattr(post, 'content_format', None), sanitize_content)
+        post.content = sanitize(req.content)
 
     await db.commit()
-    await db.refresh(post)
-    return await _to_post_response(post, user, db)
+    post, author, pts, strategy_name, is_liked, is_bookmarked = (
+        await _load_post_detail(db, post.id, user.id)
+    ).one()
+    return _to_post_response(post, author, pts, strategy_name, is_liked, is_bookmarked)
 
 
 @router.delete("/{post_id}")
 async def delete_post(
-    post_id: str,
+    post_id: UUID,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Post).where(Post.id == UUID(post_id), Post.user_id == user.id)
+    stmt = select(Post).where(Post.id == post_id, Post.user_id == user.id)
     result = await db.execute(stmt)
     post = result.scalar_one_or_none()
     if not post:
@@ -900,6 +1018,9 @@ async def delete_post(
 
     await db.delete(post)
     await db.commit()
+    background_tasks.add_task(cache_delete, TRENDING_CACHE_KEY)
+    background_tasks.add_task(cache_delete, HOT_CACHE_KEY)
+    background_tasks.add_task(invalidate_profile_cache, user.id)
     return {"message": "삭제되었습니다."}
 
 
@@ -907,162 +1028,251 @@ async def delete_post(
 
 @router.post("/{post_id}/like")
 async def toggle_like(
-    post_id: str,
+    post_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    pid = UUID(post_id)
-    stmt = select(Like).where(Like.user_id == user.id, Like.target_type == "post", Like.target_id == pid)
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        await db.delete(existing)
-        await db.execute(update(Post).where(Post.id == pid).values(like_count=Post.like_count - 1))
-        await db.commit()
-        return {"liked": False}
-    else:
-        db.add(Like(user_id=user.id, target_type="post", target_id=pid))
-        await db.execute(update(Post).where(Post.id == pid).values(like_count=Post.like_count + 1))
-        # Notify post author
-        post = await db.get(Post, pid)
-        if post:
-            await create_notification(
-                db, user_id=post.user_id, actor_id=user.id,
-                type="like", target_type="post", target_id=pid,
-                message=f"{user.nickname}님이 회원님의 글을 좋아합니다",
-            )
-            # Award points to post author for receiving a like
-            try:
-                from core.points import award_points
-                await award_points(db, post.user_id, "like_received", f"좋아요 받음: {post.title[:30]}")
-            except Exception:
-                pass
+    # Unlike: delete the like and decrement the counter in one statement.
+    removed = (
+        delete(Like)
+        .where(Like.user_id == user.id, Like.target_type == "post", Like.target_id == post_id)
+        .returning(Like.target_id)
+        .cte("removed")
+    )
+    unliked = (await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(removed.c.target_id)))
+        .values(like_count=Post.like_count - 1)
+        .returning(Post.user_id, Post.like_count)
+    )).first()
+    if unliked:
         await db.commit()
-        return {"liked": True}
+        await invalidate_profile_cache(unliked.user_id)
+        return {"liked": False, "like_count": unliked.like_count}
+
+    # Like: insert (no-op if a concurrent request already did) and increment
+    # only when a row was actually inserted.
+    inserted = (
+        pg_insert(Like)
+        .from_select(
+            [Like.user_id, Like.target_type, Like.target_id],
+            select(literal(user.id), literal("post"), Post.id).where(Post.id == post_id),
+        )
+        .on_conflict_do_nothing(constraint="uq_likes")
+        .returning(Like.target_id)
+        .cte("inserted")
+    )
+    post = (await db.execute(
+        update(Post)
+        .where(Post.id.in_(select(inserted.c.target_id)))
+        .values(like_count=Post.like_count + 1)
+        .returning(Post.user_id, Post.title, Post.like_count)
+    )).first()
+    if not post:
+        like_count = (await db.execute(select(Post.like_count).where(Post.id == post_id))).first()
+        if like_count is None:
+            raise HTTPException(404, "게시글을 찾을 수 없습니다.")
+        return {"liked": True, "like_count": like_count[0]}
+
+    # Notify post author
+    await create_notification(
+        db, user_id=post.user_id, actor_id=user.id,
+        type="like", target_type="post", target_id=post_id,
+        message=f"{user.nickname}님이 회원님의 글을 좋아합니다",
+    )
+    # Award points to post author for receiving a like
+    try:
+        await award_points(db, post.user_id, "like_received", f"좋아요 받음: {post.title[:30]}")
+    except Exception:
+        pass
+    await db.commit()
+    await invalidate_profile_cache(post.user_id)
+    return {"liked": True, "like_count": post.like_count}
 
 
 @router.post("/{post_id}/comments/{comment_id}/like")
 async def toggle_comment_like(
-    post_id: str,
-    comment_id: str,
+    post_id: UUID,
+    comment_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    cid = UUID(comment_id)
-    comment = await db.get(Comment, cid)
-    if not comment or str(comment.post_id) != post_id:
-        raise HTTPException(404, "댓글을 찾을 수 없습니다.")
-
-    stmt = select(Like).where(Like.user_id == user.id, Like.target_type == "comment", Like.target_id == cid)
-    existing = (await db.execute(stmt)).scalar_one_or_none()
-
-    if existing:
-        await db.delete(existing)
-        await db.execute(update(Comment).where(Comment.id == cid).values(like_count=Comment.like_count - 1))
-        await db.commit()
-        return {"liked": False}
-    else:
-        db.add(Like(user_id=user.id, target_type="comment", target_id=cid))
-        await db.execute(update(Comment).where(Comment.id == cid).values(like_count=Comment.like_count + 1))
-        if comment.user_id != user.id:
-            await create_notification(
-                db, user_id=comment.user_id, actor_id=user.id,
-                type="like", target_type="post", target_id=comment.post_id,
-                message=f"{user.nickname}님이 회원님의 댓글을 좋아합니다",
-            )
-            try:
-                from core.points import award_points
-                await award_points(db, comment.user_id, "like_received", "댓글 좋아요 받음")
-            except Exception:
-                pass
+    # Only comments that belong to this post can be (un)liked.
+    target = select(Comment.id).where(Comment.id == comment_id, Comment.post_id == post_id)
+
+    # Unlike: delete the like and decrement the counter in one statement.
+    removed = (
+        delete(Like)
+        .where(Like.user_id == user.id, Like.target_type == "comment", Like.target_id.in_(target))
+        .returning(Like.target_id)
+        .cte("removed")
+    )
+    unliked = (await db.execute(
+        update(Comment)
+        .where(Comment.id.in_(select(removed.c.target_id)))
+        .values(like_count=Comment.like_count - 1)
+        .returning(Comment.like_count)
+    )).first()
+    if unliked:
         await db.commit()
-        return {"liked": True}
+        await invalidate_comments_cache(post_id)
+        return {"liked": False, "like_count": unliked.like_count}
+
+    # Like: insert (no-op if a concurrent request already did) and increment
+    # only when a row was actually inserted.
+    inserted = (
+        pg_insert(Like)
+        .from_select(
+            [Like.user_id, Like.target_type, Like.target_id],
+            select(literal(user.id), literal("comment"), Comment.id)
+            .where(Comment.id == comment_id, Comment.post_id == post_id),
+        )
+        .on_conflict_do_nothing(constraint="uq_likes")
+        .returning(Like.target_id)
+        .cte("inserted")
+    )
+    comment = (await db.execute(
+        update(Comment)
+        .where(Comment.id.in_(select(inserted.c.target_id)))
+        .values(like_count=Comment.like_count + 1)
+        .returning(Comment.user_id, Comment.like_count)
+    )).first()
+    if not comment:
+        like_count = (await db.execute(select(Comment.like_count).where(Comment.id.in_(target)))).first()
+        if like_count is None:
+            raise HTTPException(404, "댓글을 찾을 수 없습니다.")
+        return {"liked": True, "like_count": like_count[0]}
+
+    if comment.user_id != user.id:
+        await create_notification(
+            db, user_id=comment.user_id, actor_id=user.id,
+            type="like", target_type="post", target_id=post_id,
+            message=f"{user.nickname}님이 회원님의 댓글을 좋아합니다",
+        )
+        try:
+            await award_points(db, comment.user_id, "like_received", "댓글 좋아요 받음")
+        except Exception:
+            pass
+    await db.commit()
+    await invalidate_comments_cache(post_id)
+    return {"liked": True, "like_count": comment.like_count}
 
 
 @router.post("/{post_id}/bookmark")
 async def toggle_bookmark(
-    post_id: str,
+    post_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    pid = UUID(post_id)
-    stmt = select(Bookmark).where(Bookmark.user_id == user.id, Bookmark.post_id == pid)
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        await db.delete(existing)
-        await db.commit()
-        return {"bookmarked": False}
-    else:
-        db.add(Bookmark(user_id=user.id, post_id=pid))
-        await db.commit()
-        return {"bookmarked": True}
+    removed = (await db.execute(
+        delete(Bookmark)
+        .where(Bookmark.user_id == user.id, Bookmark.post_id == post_id)
+        .returning(Bookmark.id)
+    )).first()
+    if not removed:
+        await db.execute(
+            pg_insert(Bookmark)
+            .values(user_id=user.id, post_id=post_id)
+            .on_conflict_do_nothing(constraint="uq_bookmarks")
+        )
+    await db.commit()
+    return {"bookmarked": not removed}
 
 
 # ─── Comments ────────────────────────────────────────────────────────────────
 
+# Anonymous comment threads (is_liked is always false) cached as the encoded
+# body; dropped whenever a comment or comment like on the post changes.
+COMMENTS_CACHE_KEY = "posts:comments:{}"
+COMMENTS_CACHE_TTL_S = 15
+
+
+async def invalidate_comments_cache(post_id) -> None:
+    await cache_delete(COMMENTS_CACHE_KEY.format(post_id))
+
+
 @router.get("/{post_id}/comments", response_model=list[CommentResponse])
 async def list_comments(
-    post_id: str,
+    post_id: UUID,
     current_user: User | None = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ):
+    """
+    Comments in thread order: each top-level comment followed by its replies
+    (depth-first, oldest first at every level), with `depth` per comment.
+    """
+    if not current_user:
+        cached = await cache_get_bytes(COMMENTS_CACHE_KEY.format(post_id))
+        if cached is not None:
+            return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    tree = _comment_tree_cte(post_id)
+    if current_user:
+        is_liked = exists().where(
+            Like.user_id == current_user.id,
+            Like.target_type == "comment",
+            Like.target_id == tree.c.id,
+        )
+    else:
+        is_liked = literal(False)
     stmt = (
-        select(Comment, User.nickname, User.plan, UserPoints.total_points)
-        .join(User, Comment.user_id == User.id)
-        .outerjoin(UserPoints, UserPoints.user_id == Comment.user_id)
-        .where(Comment.post_id == UUID(post_id))
-        .order_by(Comment.created_at.asc())
+        select(
+            tree.c.id, tree.c.user_id, tree.c.content, tree.c.like_count,
+            tree.c.parent_id, tree.c.created_at, tree.c.depth,
+            User.nickname, User.plan, UserPoints.total_points,
+            is_liked.label("is_liked"),
+        )
+        .join(User, tree.c.user_id == User.id)
+        .outerjoin(UserPoints, UserPoints.user_id == tree.c.user_id)
+        .order_by(tree.c.path)
     )
     result = await db.execute(stmt)
     rows = result.all()
 
-    # Batch check liked comment IDs for current user
-    liked_ids: set = set()
-    if current_user:
-        comment_ids = [c.id for c, *_ in rows]
-        if comment_ids:
-            liked_stmt = select(Like.target_id).where(
-                Like.user_id == current_user.id,
-                Like.target_type == "comment",
-                Like.target_id.in_(comment_ids),
-            )
-            liked_ids = {r[0] for r in (await db.execute(liked_stmt)).all()}
-
-    return [
-        CommentResponse(
-            id=str(c.id),
-            author=_author(c.user_id, nick, plan, pts),
-            content=c.content,
-            like_count=c.like_count,
-            is_liked=c.id in liked_ids,
-            parent_id=str(c.parent_id) if c.parent_id else None,
-            created_at=str(c.created_at),
-        )
-        for c, nick, plan, pts in rows
-    ]
+    payload = orjson.dumps([
+        {
+            "id": c.id,
+            "author": _author_dict(c.user_id, c.nickname, c.plan, c.total_points),
+            "content": c.content,
+            "like_count": c.like_count,
+            "is_liked": c.is_liked,
+            "parent_id": c.parent_id,
+            "depth": c.depth,
+            "created_at": c.created_at,
+        }
+        for c in rows
+    ])
+    if not current_user:
+        await cache_set_bytes(COMMENTS_CACHE_KEY.format(post_id), payload, ttl=COMMENTS_CACHE_TTL_S)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{post_id}/comments", response_model=CommentResponse)
 async def create_comment(
-    post_id: str,
+    post_id: UUID,
     req: CommentCreateRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    pid = UUID(post_id)
-    # Verify post exists
-    post = await db.get(Post, pid)
-    if not post:
+    # Post, reply-target author and the commenter's points in one round trip
+    parent_author = (
+        select(Comment.user_id).where(Comment.id == req.parent_id).scalar_subquery()
+        if req.parent_id else literal(None)
+    )
+    my_points = select(UserPoints.total_points).where(UserPoints.user_id == user.id).scalar_subquery()
+    row = (await db.execute(
+        select(Post, parent_author.label("parent_user_id"), my_points.label("total_points"))
+        .where(Post.id == post_id)
+    )).one_or_none()
+    if not row:
         raise HTTPException(404, "게시글을 찾을 수 없습니다.")
+    post, parent_user_id, total_points = row
 
     comment = Comment(
-        post_id=pid,
+        post_id=post_id,
         user_id=user.id,
         content=sanitize_text(req.content),
-        parent_id=UUID(req.parent_id) if req.parent_id else None,
+        parent_id=req.parent_id,
     )
     db.add(comment)
 
@@ -1072,53 +1282,53 @@ async def create_comment(
     # Notify post author about comment
     await create_notification(
         db, user_id=post.user_id, actor_id=user.id,
-        type="comment", target_type="post", target_id=pid,
+        type="comment", target_type="post", target_id=post_id,
         message=f"{user.nickname}님이 회원님의 글에 댓글을 남겼습니다",
     )
 
     # If it's a reply, also notify the parent comment author
-    if req.parent_id:
-        parent_comment = await db.get(Comment, UUID(req.parent_id))
-        if parent_comment:
-            await create_notification(
-                db, user_id=parent_comment.user_id, actor_id=user.id,
-                type="reply", target_type="post", target_id=pid,
-                message=f"{user.nickname}님이 회원님의 댓글에 답글을 남겼습니다",
-            )
+    if parent_user_id:
+        await create_notification(
+            db, user_id=parent_user_id, actor_id=user.id,
+            type="reply", target_type="post", target_id=post_id,
+            message=f"{user.nickname}님이 회원님의 댓글에 답글을 남겼습니다",
+        )
 
     # Award points for commenting
     try:
-        from core.points import award_points
-        await award_points(db, user.id, "comment", f"댓글 작성")
+        up = await award_points(db, user.id, "comment", f"댓글 작성")
+        if up is not None:
+            total_points = up.total_points
     except Exception:
         pass
 
     # Parse @mentions in comment content
-    import re
-    mentions = re.findall(r"@(\S+)", req.content)
+    mentions = _MENTION_RE.findall(req.content)[:5]  # max 5 mentions per comment
     if mentions:
-        for mention_nick in mentions[:5]:  # max 5 mentions per comment
-            m_stmt = select(User).where(User.nickname == mention_nick)
-            m_result = await db.execute(m_stmt)
-            mentioned_user = m_result.scalar_one_or_none()
-            if mentioned_user:
-                await create_notification(
-                    db, user_id=mentioned_user.id, actor_id=user.id,
-                    type="mention", target_type="post", target_id=pid,
-                    message=f"{user.nickname}님이 댓글에서 회원님을 언급했습니다",
-                )
+        m_stmt = select(User.id).where(User.nickname.in_(mentions))
+        mentioned_ids = (await db.execute(m_stmt)).scalars().all()
+        for mentioned_id in mentioned_ids:
+            await create_notification(
+                db, user_id=mentioned_id, actor_id=user.id,
+                type="mention", target_type="post", target_id=post_id,
+                message=f"{user.nickname}님이 댓글에서 회원님을 언급했습니다",
+            )
 
+    # ids/timestamps are client-side defaults and the session keeps them after
+    # commit (expire_on_commit=False), so no refresh SELECT is needed.
     await db.commit()
-    await db.refresh(comment)
+    await asyncio.gather(
+        invalidate_profile_cache(post.user_id),
+        invalidate_comments_cache(post_id),
+    )
 
-    c_up = (await db.execute(select(UserPoints.total_points).where(UserPoints.user_id == user.id))).scalar_one_or_none()
     return CommentResponse(
-        id=str(comment.id),
-        author=_author(user.id, user.nickname, user.plan, c_up),
+        id=comment.id,
+        author=_author(user.id, user.nickname, user.plan, total_points),
         content=comment.content,
         like_count=0,
-        parent_id=str(comment.parent_id) if comment.parent_id else None,
-        created_at=str(comment.created_at),
+        parent_id=comment.parent_id,
+        created_at=comment.created_at,
     )
 
 
@@ -1130,51 +1340,58 @@ class CommentUpdateRequest(BaseModel):
 
 @router.put("/{post_id}/comments/{comment_id}", response_model=CommentResponse)
 async def update_comment(
-    post_id: str,
-    comment_id: str,
+    post_id: UUID,
+    comment_id: UUID,
     req: CommentUpdateRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    comment = await db.get(Comment, UUID(comment_id))
-    if not comment or str(comment.user_id) != str(user.id):
+    comment = await db.get(Comment, comment_id)
+    if not comment or comment.user_id != user.id:
         raise HTTPException(404, "댓글을 찾을 수 없습니다.")
     if comment.is_deleted:
         raise HTTPException(400, "삭제된 댓글은 수정할 수 없습니다.")
 
     comment.content = sanitize_text(req.content)
     await db.commit()
-    await db.refresh(comment)
+    await invalidate_comments_cache(comment.post_id)
 
     u_up = (await db.execute(select(UserPoints.total_points).where(UserPoints.user_id == user.id))).scalar_one_or_none()
     return CommentResponse(
-        id=str(comment.id),
+        id=comment.id,
         author=_author(user.id, user.nickname, user.plan, u_up),
         content=comment.content,
         like_count=comment.like_count,
-        parent_id=str(comment.parent_id) if comment.parent_id else None,
-        created_at=str(comment.created_at),
+        parent_id=comment.parent_id,
+        created_at=comment.created_at,
     )
 
 
 @router.delete("/{post_id}/comments/{comment_id}")
 async def delete_comment(
-    post_id: str,
-    comment_id: str,
+    post_id: UUID,
+    comment_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    comment = await db.get(Comment, UUID(comment_id))
-    if not comment or str(comment.user_id) != str(user.id):
+    comment = await db.get(Comment, comment_id)
+    if not comment or comment.user_id != user.id:
         raise HTTPException(404, "댓글을 찾을 수 없습니다.")
 
     comment.is_deleted = True
     comment.content = "(삭제된 댓글입니다)"
-    # Decrement post comment count
-    post = await db.get(Post, UUID(post_id))
-    if post and post.comment_count > 0:
-        post.comment_count -= 1
+    # Decrement post comment count in place; RETURNING gives the author for
+    # cache invalidation without loading the post.
+    post_author_id = (await db.execute(
+        update(Post)
+        .where(Post.id == post_id, Post.comment_count > 0)
+        .values(comment_count=Post.comment_count - 1, updated_at=Post.updated_at)
+        .returning(Post.user_id)
+    )).scalar_one_or_none()
     await db.commit()
+    await invalidate_comments_cache(comment.post_id)
+    if post_author_id:
+        await invalidate_profile_cache(post_author_id)
     return {"ok": True}
 
 
@@ -1182,174 +1399,349 @@ async def delete_comment(
 
 @router.post("/{post_id}/copy-strategy")
 async def copy_strategy_from_post(
-    post_id: str,
+    post_id: UUID,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    post = await db.get(Post, UUID(post_id))
-    if not post or not post.strategy_id:
-        raise HTTPException(400, "이 게시글에는 전략이 첨부되어 있지 않습니다.")
-
-    strategy = await db.get(Strategy, post.strategy_id)
-    if not strategy or not strategy.is_public:
+    # Bump the source strategy's copy_count and insert the copy in one
+    # statement; both are skipped unless the post has a public strategy.
+    bumped = (
+        update(Strategy)
+        .where(
+            Strategy.id == select(Post.strategy_id).where(Post.id == post_id).scalar_subquery(),
+            Strategy.is_public == True,
+        )
+        .values(copy_count=func.coalesce(Strategy.copy_count, 0) + 1, updated_at=func.now())
+        .returning(
+            Strategy.user_id, Strategy.name, Strategy.description,
+            Strategy.pair, Strategy.timeframe, Strategy.config_json,
+        )
+        .cte("bumped")
+    )
+    copied = (
+        insert(Strategy)
+        .from_select(
+            [Strategy.user_id, Strategy.name, Strategy.description,
+             Strategy.pair, Strategy.timeframe, Strategy.config_json],
+            select(
+                literal(user.id), bumped.c.name + " (복사본)", bumped.c.description,
+                bumped.c.pair, bumped.c.timeframe, bumped.c.config_json,
+            ),
+        )
+        .returning(Strategy.id)
+        .cte("copied")
+    )
+    strategy = (await db.execute(
+        select(copied.c.id, bumped.c.user_id, bumped.c.name).select_from(copied).join(bumped, true())
+    )).first()
+    if not strategy:
+        source = (await db.execute(
+            select(Strategy.is_public)
+            .select_from(Post)
+            .join(Strategy, Post.strategy_id == Strategy.id)
+            .where(Post.id == post_id)
+        )).first()
+        if source is None:
+            raise HTTPException(400, "이 게시글에는 전략이 첨부되어 있지 않습니다.")
         raise HTTPException(403, "비공개 전략은 복사할 수 없습니다.")
 
-    new_strategy = Strategy(
-        user_id=user.id,
-        name=f"{strategy.name} (복사본)",
-        description=strategy.description,
-        pair=strategy.pair,
-        timeframe=strategy.timeframe,
-        config_json=strategy.config_json,
-    )
-    db.add(new_strategy)
-    strategy.copy_count = (strategy.copy_count or 0) + 1
     # Notify strategy owner
     await create_notification(
         db, user_id=strategy.user_id, actor_id=user.id,
-        type="copy_strategy", target_type="post", target_id=post.id,
+        type="copy_strategy", target_type="post", target_id=post_id,
         message=f"{user.nickname}님이 회원님의 전략을 복사했습니다",
     )
     # Award points to strategy owner and copier
     try:
-        from core.points import award_points
         await award_points(db, strategy.user_id, "strategy_copied", f"전략 복사됨: {strategy.name[:30]}")
         await award_points(db, user.id, "marketplace_copy", f"마켓 전략 복사: {strategy.name[:30]}")
     except Exception:
         pass
     await db.commit()
-    await db.refresh(new_strategy)
+    await invalidate_profile_cache(strategy.user_id)
 
-    return {"strategy_id": str(new_strategy.id), "message": "전략이 복사되었습니다."}
+    return {"strategy_id": str(strategy.id), "message": "전략이 복사되었습니다."}
 
 
 # ─── Reactions ───────────────────────────────────────────────────────────────
 
 class ReactionRequest(BaseModel):
-    emoji: str  # fire, rocket, eyes, thinking, thumbsup, heart
-
-
-class ReactionCountItem(BaseModel):
-    emoji: str
-    count: int
-    reacted: bool = False
+    emoji: Literal["thumbsup", "heart", "fire", "rocket", "eyes", "thinking"]
 
 
 @router.post("/{post_id}/react")
 async def toggle_reaction(
-    post_id: str,
+    post_id: UUID,
     req: ReactionRequest,
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    allowed_emojis = {"thumbsup", "heart", "fire", "rocket", "eyes", "thinking"}
-    if req.emoji not in allowed_emojis:
-        raise HTTPException(400, "허용되지 않는 이모지입니다.")
-
-    pid = UUID(post_id)
-    stmt = select(Reaction).where(
-        Reaction.user_id == user.id,
-        Reaction.target_type == "post",
-        Reaction.target_id == pid,
-        Reaction.emoji == req.emoji,
-    )
-    existing = (await db.execute(stmt)).scalar_one_or_none()
+    removed = (await db.execute(
+        delete(Reaction)
+        .where(
+            Reaction.user_id == user.id,
+            Reaction.target_type == "post",
+            Reaction.target_id == post_id,
+            Reaction.emoji == req.emoji,
+        )
+        .returning(Reaction.id)
+    )).first()
+    if not removed:
+        await db.execute(
+            pg_insert(Reaction)
+            .values(user_id=user.id, target_type="post", target_id=post_id, emoji=req.emoji)
+            .on_conflict_do_nothing(constraint="uq_reactions")
+        )
+    await db.commit()
+    await cache_delete(REACTIONS_CACHE_KEY.format(post_id))
+    return {"reacted": not removed, "emoji": req.emoji}
 
-    if existing:
-        await db.delete(existing)
-        await db.commit()
-        return {"reacted": False, "emoji": req.emoji}
-    else:
-        db.add(Reaction(
-            user_id=user.id,
-            target_type="post",
-            target_id=pid,
-            emoji=req.emoji,
-        ))
-        await db.commit()
-        return {"reacted": True, "emoji": req.emoji}
+
+# Per post, a hash of viewer ("anon" or user id) -> encoded reaction list, so a
+# single DEL on toggle drops every viewer's copy.
+REACTIONS_CACHE_KEY = "posts:reactions:{}"
+REACTIONS_CACHE_TTL_S = 15
 
 
 @router.get("/{post_id}/reactions", response_model=list[ReactionCountItem])
 async def get_reactions(
-    post_id: str,
+    post_id: UUID,
     current_user: User | None = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db),
 ):
-    pid = UUID(post_id)
-    # Counts per emoji
+    key = REACTIONS_CACHE_KEY.format(post_id)
+    viewer = str(current_user.id) if current_user else "anon"
+    try:
+        r = await get_redis()
+        cached = await r.hget(key, viewer)
+    except Exception as e:
+        logger.warning(f"Reactions cache read failed for post {post_id}: {e}")
+        r = cached = None
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"X-Cache": "HIT"})
+
+    # Counts per emoji, and whether the current user is among the reactors
+    reacted = func.bool_or(Reaction.user_id == current_user.id) if current_user else literal(False)
     stmt = (
-        select(Reaction.emoji, func.count().label("cnt"))
-        .where(Reaction.target_type == "post", Reaction.target_id == pid)
+        select(Reaction.emoji, func.count().label("cnt"), reacted.label("reacted"))
+        .where(Reaction.target_type == "post", Reaction.target_id == post_id)
         .group_by(Reaction.emoji)
     )
     rows = (await db.execute(stmt)).all()
 
-    # Which emojis current user reacted with
-    my_emojis: set = set()
-    if current_user:
-        my_stmt = select(Reaction.emoji).where(
-            Reaction.user_id == current_user.id,
-            Reaction.target_type == "post",
-            Reaction.target_id == pid,
-        )
-        my_emojis = {r[0] for r in (await db.execute(my_stmt)).all()}
-
-    return [
-        ReactionCountItem(emoji=emoji, count=cnt, reacted=emoji in my_emojis)
-        for emoji, cnt in rows
-    ]
+    payload = orjson.dumps([
+        {"emoji": emoji, "count": cnt, "reacted": bool(me)}
+        for emoji, cnt, me in rows
+    ])
+    if r is not None:
+        try:
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.hset(key, viewer, payload)
+                pipe.expire(key, REACTIONS_CACHE_TTL_S)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Reactions cache write failed for post {post_id}: {e}")
+    return Response(content=payload, media_type="application/json", headers={"X-Cache": "MISS"})
 
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
+_MENTION_RE = re.compile(r"@(\S+)")
+_MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MD_LINK_RE = re.compile(r"\[[^\]]*\]\([^)]*\)")
+_MD_SYNTAX_RE = re.compile(r"[#*`>_~\-]+")
+
+
 def _excerpt(content: str, max_len: int = 120) -> str | None:
     """Extract plain-text excerpt from post content (strips markdown images/links)."""
-    import re
-    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", "", content or "")  # remove images
-    text = re.sub(r"\[[^\]]*\]\([^)]*\)", r"", text)           # remove links
-    text = re.sub(r"[#*`>_~\-]+", "", text)                    # strip markdown syntax
-    text = " ".join(text.split())                               # collapse whitespace
+    text = _MD_IMAGE_RE.sub("", content or "")   # remove images
+    text = _MD_LINK_RE.sub("", text)             # remove links
+    text = _MD_SYNTAX_RE.sub("", text)           # strip markdown syntax
+    text = " ".join(text.split())                # collapse whitespace
     return text[:max_len].rstrip() + "…" if len(text) > max_len else (text or None)
 
 
-def _thumbnail(content: str) -> str | None:
-    """Extract first image URL from markdown content."""
-    import re
-    m = re.search(r"!\[[^\]]*\]\(([^)]+)\)", content or "")
-    return m.group(1) if m else None
+# List views never need the full body: the excerpt is cut from the head of the
+# content and the thumbnail (first markdown image URL) is extracted in SQL, so
+# Post.content itself never leaves the database.
+_EXCERPT_SOURCE_CHARS = 2000
+_THUMBNAIL_PATTERN = r"!\[[^]]*\]\(([^)]+)\)"
+
+# Columns the post list views read, selected directly so list endpoints get
+# plain rows instead of hydrated Post instances.
+_POST_LIST_COLUMNS = (
+    Post.id, Post.user_id, Post.category, Post.title,
+    func.left(Post.content, _EXCERPT_SOURCE_CHARS).label("content_head"),
+    func.substring(Post.content, _THUMBNAIL_PATTERN).label("thumbnail_url"),
+    Post.like_count, Post.comment_count, Post.view_count, Post.strategy_id,
+    Post.verified_profit_pct, Post.is_pinned, Post.created_at,
+)
+
+
+def _public_json_response(request: Request, payload: bytes, max_age: int, x_cache: str | None = None) -> Response:
+    """
+    Viewer-independent JSON body that CDNs and browsers may cache for max_age
+    seconds (the server-side TTL). Tagged with a content ETag; a matching
+    If-None-Match gets an empty 304.
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+    headers = {
+        "Cache-Control": f"public, max-age={max_age}, s-maxage={max_age}, stale-while-revalidate={max_age * 2}",
+        "ETag": etag,
+    }
+    if x_cache:
+        headers["X-Cache"] = x_cache
+    if_none_match = request.headers.get("if-none-match", "")
+    client_tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    if etag in client_tags or "*" in client_tags:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _post_list_item(row, author) -> dict:
+    """PostListItem-shaped dict from a row mapping selected with _POST_LIST_COLUMNS."""
+    return {
+        "id": row["id"],
+        "author": author,
+        "category": row["category"],
+        "title": row["title"],
+        "excerpt": _excerpt(row["content_head"]),
+        "thumbnail_url": row["thumbnail_url"],
+        "like_count": row["like_count"],
+        "comment_count": row["comment_count"],
+        "view_count": row["view_count"],
+        "has_strategy": row["strategy_id"] is not None,
+        "verified_profit_pct": row["verified_profit_pct"],
+        "is_pinned": row["is_pinned"],
+        "is_liked": False,
+        "is_bookmarked": False,
+        "created_at": row["created_at"],
+    }
+
+
+async def _add_pending_views(items: list[dict]) -> None:
+    """Add views still buffered in Redis so list counts match get_post."""
+    pending = await pending_views([item["id"] for item in items])
+    for item in items:
+        item["view_count"] = (item["view_count"] or 0) + pending.get(item["id"], 0)
+
+
+async def _mark_viewer_state(db: AsyncSession, user_id, items: list[dict]) -> None:
+    """Set is_liked / is_bookmarked on list item dicts with one query each."""
+    post_ids = [item["id"] for item in items]
+    liked = await batch_liked_post_ids(db, user_id, post_ids)
+    bookmarked = await batch_bookmarked_post_ids(db, user_id, post_ids)
+    for item in items:
+        item["is_liked"] = item["id"] in liked
+        item["is_bookmarked"] = item["id"] in bookmarked
+
+
+def _author_dict(user_id, nickname: str, plan: str, total_points) -> dict:
+    """AuthorInfo-shaped dict with computed level, for ORJSONResponse payloads."""
+    lv, lv_name = compute_level(total_points or 0)
+    return {"id": user_id, "nickname": nickname, "plan": plan, "level": lv, "level_name": lv_name}
+
+
+async def _load_authors(db: AsyncSession, user_ids) -> dict:
+    """user_id -> AuthorInfo-shaped dict, read through the Redis author bundle cache."""
+    infos = await get_author_infos(db, user_ids)
+    return {uid: _author_dict(uid, *info) for uid, info in infos.items()}
 
 
 def _author(user_id, nickname: str, plan: str, total_points) -> AuthorInfo:
     """Build AuthorInfo with computed level."""
     lv, lv_name = compute_level(total_points or 0)
-    return AuthorInfo(id=str(user_id), nickname=nickname, plan=plan, level=lv, level_name=lv_name)
+    return AuthorInfo(id=user_id, nickname=nickname, plan=plan, level=lv, level_name=lv_name)
 
 
-async def _to_post_response(post: Post, author: User, db: AsyncSession,
-                            current_user_id=None, strategy_name=None) -> PostResponse:
-    is_liked = False
-    is_bookmarked = False
+def _comment_sort_key(c):
+    # Fixed-width timestamp then id, so text order is (created_at, id) order.
+    return func.to_char(c.created_at, "YYYYMMDDHH24MISSUS").concat(cast(c.id, String))
 
-    if current_user_id:
-        stmt = select(Like).where(
-            Like.user_id == current_user_id, Like.target_type == "post", Like.target_id == post.id
+
+def _comment_tree_cte(post_id):
+    """
+    Recursive CTE over a post's comments. `path` is the chain of sort keys from
+    the root, so ORDER BY path yields the thread pre-order in one query.
+
+    Replies whose parent is missing or belongs to another post are anchored as
+    roots, so they still appear (as the old flat listing showed them).
+    """
+    parent = aliased(Comment)
+    parent_in_post = exists().where(parent.id == Comment.parent_id, parent.post_id == post_id)
+    tree = (
+        select(
+            Comment.id, Comment.user_id, Comment.content, Comment.like_count,
+            Comment.parent_id, Comment.created_at,
+            pg_array([_comment_sort_key(Comment)]).label("path"),
+            literal(0).label("depth"),
+        )
+        .where(Comment.post_id == post_id, Comment.parent_id.is_(None) | ~parent_in_post)
+        .cte("comment_tree", recursive=True)
+    )
+    reply = aliased(Comment)
+    return tree.union_all(
+        select(
+            reply.id, reply.user_id, reply.content, reply.like_count,
+            reply.parent_id, reply.created_at,
+            func.array_append(tree.c.path, _comment_sort_key(reply)),
+            tree.c.depth + 1,
+        )
+        .join(tree, reply.parent_id == tree.c.id)
+        # Redundant for correctness, but keeps each step on ix_comments_post_parent.
+        .where(reply.post_id == post_id)
+    )
+
+
+def _build_post_detail_stmt(with_viewer: bool):
+    """
+    One SELECT for everything PostResponse needs: the post, its author and
+    level points, the linked strategy name, and the viewer's like/bookmark flags.
+    """
+    if with_viewer:
+        viewer_id = bindparam("viewer_id")
+        is_liked = exists().where(
+            Like.user_id == viewer_id, Like.target_type == "post", Like.target_id == Post.id
+        )
+        is_bookmarked = exists().where(Bookmark.user_id == viewer_id, Bookmark.post_id == Post.id)
+    else:
+        is_liked = is_bookmarked = literal(False)
+    return (
+        select(
+            Post, User, UserPoints.total_points, Strategy.name,
+            is_liked.label("is_liked"), is_bookmarked.label("is_bookmarked"),
         )
-        is_liked = (await db.execute(stmt)).scalar_one_or_none() is not None
+        .join(User, Post.user_id == User.id)
+        .outerjoin(UserPoints, UserPoints.user_id == Post.user_id)
+        .outerjoin(Strategy, Post.strategy_id == Strategy.id)
+        .where(Post.id == bindparam("post_id"))
+        .execution_options(populate_existing=True)
+    )
 
-        stmt = select(Bookmark).where(Bookmark.user_id == current_user_id, Bookmark.post_id == post.id)
-        is_bookmarked = (await db.execute(stmt)).scalar_one_or_none() is not None
 
-    if not strategy_name and post.strategy_id:
-        strategy = await db.get(Strategy, post.strategy_id)
-        strategy_name = strategy.name if strategy else None
+# Built once: every get/create/update of a post executes the same statement
+# object, so SQLAlchemy's compiled cache and asyncpg's prepared statement
+# cache always hit and the select() isn't rebuilt per request.
+_POST_DETAIL = _build_post_detail_stmt(with_viewer=False)
+_POST_DETAIL_VIEWER = _build_post_detail_stmt(with_viewer=True)
 
-    # Fetch author level
-    up = (await db.execute(select(UserPoints.total_points).where(UserPoints.user_id == author.id))).scalar_one_or_none()
 
+async def _load_post_detail(db: AsyncSession, post_id, current_user_id=None):
+    """Result of the post detail SELECT; rows are (post, author, points, strategy_name, is_liked, is_bookmarked)."""
+    if current_user_id:
+        return await db.execute(_POST_DETAIL_VIEWER, {"post_id": post_id, "viewer_id": current_user_id})
+    return await db.execute(_POST_DETAIL, {"post_id": post_id})
+
+
+def _to_post_response(post: Post, author: User, author_points, strategy_name=None,
+                      is_liked: bool = False, is_bookmarked: bool = False) -> PostResponse:
+    """
+    Pure serializer: author points, strategy name and viewer flags are passed in
+    (see _load_post_detail), so it never touches the session or lazy relationships.
+    """
     return PostResponse(
         id=str(post.id),
-        author=_author(author.id, author.nickname, author.plan, up),
+        author=_author(author.id, author.nickname, author.plan, author_points),
         category=post.category,
         title=post.title,
         content=post.content,
@@ -1360,9 +1752,9 @@ async def _to_post_response(post: Post, author: User, db: AsyncSession,
         like_count=post.like_count,
         comment_count=post.comment_count,
         view_count=post.view_count,
-        is_liked=is_liked,
-        is_bookmarked=is_bookmarked,
+        is_liked=bool(is_liked),
+        is_bookmarked=bool(is_bookmarked),
         is_pinned=post.is_pinned,
-        created_at=str(post.created_at),
-        updated_at=str(post.updated_at),
+        created_at=post.created_at,
+        updated_at=post.updated_at,
     )
@@ -125,9 +125,10 @@ async def claim_quest_reward(
     user_points.total_points = (user_points.total_points or 0) + points
 
     # Update level
-    from core.points import compute_level
+    from core.points import compute_level, queue_leaderboard_sync
     level_num, _ = compute_level(user_points.total_points)
     user_points.level = level_num
+    queue_leaderboard_sync(db, user.id, user_points.total_points)
 
     # Log points
     log = PointLog(
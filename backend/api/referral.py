@@ -14,6 +14,8 @@ from core.points import compute_level
 
 router = APIRouter(prefix="/api/referral", tags=["referral"])
 
+_REF_LINK_TMPL = "https://bitram.co.kr/register?ref={}"
+
 
 def _generate_code() -> str:
     return secrets.token_urlsafe(8)[:10].upper()
@@ -37,12 +39,12 @@ async def get_my_referral_code(
     # Generate referral code if not exists
     if not user.referral_code:
         user.referral_code = _generate_code()
+        # The code is set locally and expire_on_commit=False keeps it, so no refresh.
         await db.commit()
-        await db.refresh(user)
 
     return {
         "code": user.referral_code,
-        "link": f"https://bitram.co.kr/register?ref={user.referral_code}",
+        "link": _REF_LINK_TMPL.format(user.referral_code),
     }
 
 
@@ -52,18 +54,14 @@ async def get_referral_stats(
     db: AsyncSession = Depends(get_db),
 ):
     stmt = (
-        select(func.count())
+        select(
+            func.count(),
+            func.count().filter(Referral.rewarded == True),
+        )
         .select_from(Referral)
         .where(Referral.referrer_id == user.id)
     )
-    total = (await db.execute(stmt)).scalar() or 0
-
-    stmt = (
-        select(func.count())
-        .select_from(Referral)
-        .where(Referral.referrer_id == user.id, Referral.rewarded == True)
-    )
-    rewarded = (await db.execute(stmt)).scalar() or 0
+    total, rewarded = (await db.execute(stmt)).one()
 
     return {
         "total_referrals": total,
@@ -78,8 +76,21 @@ async def get_my_referrals(
     db: AsyncSession = Depends(get_db),
 ):
     """List all referred users with their activity stats and milestone status."""
+    # Per-user post count as a correlated subquery (served by ix_posts_user_id),
+    # so it's computed for just the referred users in the same round trip.
+    post_count_sq = (
+        select(func.count())
+        .select_from(Post)
+        .where(Post.user_id == Referral.referred_id)
+        .correlate(Referral)
+        .scalar_subquery()
+        .label("post_count")
+    )
     stmt = (
-        select(Referral, User, UserPoints.total_points)
+        select(
+            Referral.milestones_json, User.id, User.nickname, User.created_at,
+            UserPoints.total_points, post_count_sq,
+        )
         .join(User, Referral.referred_id == User.id)
         .outerjoin(UserPoints, UserPoints.user_id == Referral.referred_id)
         .where(Referral.referrer_id == user.id)
@@ -89,22 +100,17 @@ async def get_my_referrals(
     rows = result.all()
 
     items = []
-    for referral, referred_user, total_pts in rows:
-        # Get post count for the referred user
-        post_count = (await db.execute(
-            select(func.count()).select_from(Post).where(Post.user_id == referred_user.id)
-        )).scalar() or 0
-
-        lv, lv_name = compute_level(total_pts or 0)
+    for row in rows:
+        lv, lv_name = compute_level(row.total_points or 0)
 
         items.append(ReferredUserInfo(
-            id=str(referred_user.id),
-            nickname=referred_user.nickname,
+            id=str(row.id),
+            nickname=row.nickname,
             level=lv,
             level_name=lv_name,
-            post_count=post_count,
-            joined_at=str(referred_user.created_at),
-            milestones=referral.milestones_json or {},
+            post_count=row.post_count or 0,
+            joined_at=str(row.created_at),
+            milestones=row.milestones_json or {},
         ))
 
     return items
@@ -2,15 +2,21 @@
 Search API: full-text search for posts and users.
 Uses PostgreSQL tsvector for post search with ILIKE fallback.
 """
+import re
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, text
+from sqlalchemy import select, func
 
 from db.database import get_db
 from db.models import User, Post
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
+# Words are passed to to_tsquery, so only word characters may reach it.
+_WORD_RE = re.compile(r"\w+")
+_MIN_FTS_TERM_LEN = 2
+
 
 @router.get("/posts")
 async def search_posts(
@@ -20,28 +26,29 @@ async def search_posts(
     size: int = Query(20, ge=1, le=50),
     db: AsyncSession = Depends(get_db),
 ):
-    """Search posts using full-text search (tsvector) with ILIKE fallback."""
-    # Try full-text search first, fall back to ILIKE if search_vector column doesn't exist
-    try:
-        ts_query = func.to_tsquery("simple", " & ".join(q.split()))
-        stmt = (
-            select(Post, User.nickname, User.plan)
-            .join(User, Post.user_id == User.id)
-            .where(
-                or_(
-                    Post.search_vector.op("@@")(ts_query),
-                    Post.title.ilike(f"%{q}%"),
-                )
-            )
-        )
-    except Exception:
-        # Fallback to ILIKE if search_vector not available
-        pattern = f"%{q}%"
-        stmt = (
-            select(Post, User.nickname, User.plan)
-            .join(User, Post.user_id == User.id)
-            .where(or_(Post.title.ilike(pattern), Post.content.ilike(pattern)))
+    """
+    Search posts: word-prefix full-text match on title and content (tsvector),
+    OR a substring match on the title (ILIKE). Both are GIN-indexed.
+    """
+    # Substring match inside words ("코인" in "비트코인") only works through
+    # ILIKE; ix_posts_title_trgm serves it. Content is matched by word prefix only.
+    condition = Post.title.ilike(f"%{q}%")
+    terms = _WORD_RE.findall(q)
+    if terms and max(len(t) for t in terms) >= _MIN_FTS_TERM_LEN:
+        # Prefix match per word ("비트" finds "비트코인"), all words required.
+        ts_query = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms))
+        condition = Post.search_vector.op("@@")(ts_query) | condition
+
+    stmt = (
+        select(
+            Post.id, Post.user_id, Post.category, Post.title,
+            Post.like_count, Post.comment_count, Post.view_count, Post.strategy_id,
+            Post.verified_profit_pct, Post.is_pinned, Post.created_at,
+            User.nickname, User.plan,
         )
+        .join(User, Post.user_id == User.id)
+        .where(condition)
+    )
 
     if category:
         stmt = stmt.where(Post.category == category)
@@ -55,22 +62,19 @@ async def search_posts(
 
     return [
         {
-            "id": str(post.id),
-            "author": {"id": str(post.user_id), "nickname": nickname, "plan": plan},
-            "category": post.category,
-            "title": post.title,
-            "like_count": post.like_count,
-            "comment_count": post.comment_count,
-            "view_count": post.view_count,
-            "has_strategy": post.strategy_id is not None,
-            "verified_profit_pct": (
-                post.verified_profit.get("total_return_pct")
-                if post.verified_profit else None
-            ),
-            "is_pinned": post.is_pinned,
-            "created_at": str(post.created_at),
+            "id": str(row.id),
+            "author": {"id": str(row.user_id), "nickname": row.nickname, "plan": row.plan},
+            "category": row.category,
+            "title": row.title,
+            "like_count": row.like_count,
+            "comment_count": row.comment_count,
+            "view_count": row.view_count,
+            "has_strategy": row.strategy_id is not None,
+            "verified_profit_pct": row.verified_profit_pct,
+            "is_pinned": row.is_pinned,
+            "created_at": row.created_at,
         }
-        for post, nickname, plan in rows
+        for row in rows
     ]
 
 
@@ -83,15 +87,20 @@ async def search_users(
 ):
     """Search users by nickname."""
     pattern = f"%{q}%"
+    # Counted per matching user (ix_posts_user_id) instead of joining and
+    # grouping every post of every match.
+    post_count_sq = (
+        select(func.count())
+        .select_from(Post)
+        .where(Post.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+        .label("post_count")
+    )
     stmt = (
-        select(
-            User.id, User.nickname, User.plan, User.created_at,
-            func.count(Post.id).label("post_count"),
-        )
-        .outerjoin(Post, Post.user_id == User.id)
+        select(User.id, User.nickname, User.plan, User.created_at, post_count_sq)
         .where(User.nickname.ilike(pattern), User.is_active == True)
-        .group_by(User.id)
-        .order_by(func.count(Post.id).desc())
+        .order_by(post_count_sq.desc(), User.id)
         .offset((page - 1) * size)
         .limit(size)
     )
@@ -6,6 +6,17 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DATABASE_URL_SYNC: str
+    # Per-process async pool. Keep small: every uvicorn/celery process opens its own.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    # SQLAlchemy compiled-SQL LRU (per engine) and asyncpg prepared statement
+    # LRU (per connection; ignored when DB_PGBOUNCER is set).
+    DB_QUERY_CACHE_SIZE: int = 1000
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    # Set when DATABASE_URL points at PgBouncer in transaction-pool mode
+    # (disables asyncpg's per-connection prepared statement cache).
+    DB_PGBOUNCER: bool = False
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
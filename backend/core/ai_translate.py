@@ -170,3 +170,20 @@ async def translate_text(
         except Exception as e2:
             logger.warning(f"translate_text failed ({fallback}): {e2}")
             return text
+
+
+# Providers are remote HTTP APIs (I/O-bound), so batches fan out on the event
+# loop; the semaphore keeps a single feed refresh from bursting the provider.
+_batch_semaphore = asyncio.Semaphore(6)
+
+
+async def translate_many(texts: list[str], target_lang: str = "ko") -> list[str]:
+    """Translate several texts concurrently, preserving order."""
+
+    async def _one(text: str) -> str:
+        if not text:
+            return ""
+        async with _batch_semaphore:
+            return await translate_text(text, target_lang=target_lang)
+
+    return list(await asyncio.gather(*[_one(t) for t in texts]))
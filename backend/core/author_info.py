@@ -0,0 +1,80 @@
+"""
+Author bundle cache: (nickname, plan, total_points) per user.
+
+Post feeds stamp every item with its author's nickname, plan and level. Keeping
+that bundle in Redis lets feed queries read posts alone instead of joining
+users and user_points on every request.
+"""
+import logging
+from uuid import UUID
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import User, UserPoints
+from core.redis_cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+AUTHOR_INFO_TTL_S = 300
+
+
+def author_info_key(user_id) -> str:
+    return f"user:{user_id}:authorinfo"
+
+
+async def get_author_infos(db: AsyncSession, user_ids) -> dict[UUID, tuple]:
+    """user_id -> (nickname, plan, total_points); one MGET, plus one SELECT for misses."""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+
+    infos: dict[UUID, tuple] = {}
+    r = None
+    try:
+        r = await get_redis()
+        cached = await r.mget([author_info_key(uid) for uid in user_ids])
+        for uid, raw in zip(user_ids, cached):
+            if raw is not None:
+                infos[uid] = tuple(orjson.loads(raw))
+    except Exception as e:
+        logger.warning(f"Author info cache read failed: {e}")
+        r = None
+
+    missing = [uid for uid in user_ids if uid not in infos]
+    if missing:
+        rows = (await db.execute(
+            select(User.id, User.nickname, User.plan, UserPoints.total_points)
+            .outerjoin(UserPoints, UserPoints.user_id == User.id)
+            .where(User.id.in_(missing))
+        )).all()
+        for uid, nickname, plan, total_points in rows:
+            infos[uid] = (nickname, plan, total_points)
+        if r is not None and rows:
+            try:
+                async with r.pipeline(transaction=False) as pipe:
+                    for uid, nickname, plan, total_points in rows:
+                        pipe.set(
+                            author_info_key(uid),
+                            orjson.dumps([nickname, plan, total_points]),
+                            ex=AUTHOR_INFO_TTL_S,
+                        )
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Author info cache write failed: {e}")
+    return infos
+
+
+async def invalidate_author_info(user_id, r=None) -> None:
+    """
+    Call after a user's nickname, plan or points change. Pass r (a client
+    created in the current loop) from Celery tasks, whose asyncio.run() loops
+    can't reuse the shared pool's connections.
+    """
+    try:
+        if r is None:
+            r = await get_redis()
+        await r.delete(author_info_key(user_id))
+    except Exception as e:
+        logger.warning(f"Author info invalidation failed for user {user_id}: {e}")
@@ -4,13 +4,15 @@ import asyncio
 import logging
 import time
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Optional
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 import httpx
 
+from core.redis_cache import cache_get, cache_set
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,17 +167,44 @@ _feed_cache = FeedCache(ttl_s=60)
 _http = httpx.AsyncClient(timeout=8.0, follow_redirects=True, headers={"User-Agent": "BITRAM/1.0"})
 
 
+_VALIDATOR_TTL_S = 86400  # keep ETag/Last-Modified + parsed entries for a day
+
+
 async def fetch_feed(url: str, source: str) -> list[FeedEntry]:
     cached = await _feed_cache.get(url)
     if cached is not None:
         return cached
 
+    # Conditional GET: replay the last validators so unchanged feeds answer 304
+    # and we reuse the previously parsed entries instead of re-downloading.
+    meta_key = f"feed:meta:{url}"
+    meta = await cache_get(meta_key)
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
     try:
-        resp = await _http.get(url)
+        resp = await _http.get(url, headers=headers)
+        if resp.status_code == 304 and meta:
+            parsed = [FeedEntry(**e) for e in meta.get("entries") or []]
+            await _feed_cache.set(url, parsed)
+            return parsed
         resp.raise_for_status()
         xml = resp.text
         parsed = parse_feed(xml, source=source)
         await _feed_cache.set(url, parsed)
+
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if etag or last_modified:
+            await cache_set(
+                meta_key,
+                {"etag": etag, "last_modified": last_modified, "entries": [asdict(e) for e in parsed]},
+                ttl=_VALIDATOR_TTL_S,
+            )
         return parsed
     except Exception as e:
         logger.warning(f"Failed to fetch feed {url}: {e}")
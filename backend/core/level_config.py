@@ -1,6 +1,7 @@
 """
 Level System Configuration: detailed level info with colors, perks, and progress calculation.
 """
+import functools
 
 LEVEL_CONFIG = {
     1: {"name": "석탄", "color": "#78716c", "min_points": 0, "perks": []},
@@ -70,8 +71,12 @@ def get_level_progress(total_points: int, current_level: int) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_levels() -> list[dict]:
-    """Return all level configs as a list, sorted by level number."""
+    """Return all level configs as a list, sorted by level number.
+
+    LEVEL_CONFIG is static, so the table is built once; callers must not mutate it.
+    """
     return [
         {
             "level": lvl,
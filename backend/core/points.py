@@ -1,12 +1,18 @@
 """
 Points & Level system core logic.
 """
+import asyncio
 import logging
+from bisect import bisect_right
 from datetime import datetime, timezone, timedelta, date
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, exists, literal, event
+from sqlalchemy.orm import Session
 
 from db.models import UserPoints, PointLog
+from core.redis_cache import get_redis
+from core.author_info import author_info_key
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,9 @@ LEVEL_THRESHOLDS = [
     (20000, "에메랄드", 9),
     (50000, "다이아몬드", 10),
 ]
+_LEVEL_BOUNDS = [threshold for threshold, _, _ in LEVEL_THRESHOLDS]
+# compute_level results, built once so a lookup returns a shared tuple.
+_LEVEL_RESULTS = [(level_num, level_name) for _, level_name, level_num in LEVEL_THRESHOLDS]
 
 POINT_VALUES = {
     "login": 5,
@@ -59,6 +68,9 @@ FOLLOWER_MILESTONES = [
     (500, "follower_milestone_500"),
     (1000, "follower_milestone_1000"),
 ]
+# Follower counts move one at a time, so a milestone is reached exactly when
+# the new count equals its threshold.
+FOLLOWER_MILESTONE_BY_COUNT = dict(FOLLOWER_MILESTONES)
 
 # Daily limits for repeatable actions: action -> max per day
 DAILY_LIMITS = {
@@ -79,25 +91,24 @@ ONE_TIME_EVENTS = {
 
 def compute_level(total_points: int) -> tuple[int, str]:
     """Returns (level_number, level_name) for a given point total."""
-    level_num = 1
-    level_name = "석탄"
-    for threshold, name, num in LEVEL_THRESHOLDS:
-        if total_points >= threshold:
-            level_num = num
-            level_name = name
-    return level_num, level_name
+    idx = bisect_right(_LEVEL_BOUNDS, total_points) - 1
+    if idx < 0:
+        return 1, "석탄"
+    return _LEVEL_RESULTS[idx]
 
 
 def next_level_info(total_points: int) -> dict:
     """Returns info about the next level."""
-    for i, (threshold, name, num) in enumerate(LEVEL_THRESHOLDS):
-        if total_points < threshold:
-            return {
-                "next_level": num,
-                "next_level_name": name,
-                "points_needed": threshold - total_points,
-                "next_threshold": threshold,
-            }
+    # First threshold strictly above total_points, same bisect as compute_level.
+    idx = bisect_right(_LEVEL_BOUNDS, total_points)
+    if idx < len(LEVEL_THRESHOLDS):
+        threshold, name, num = LEVEL_THRESHOLDS[idx]
+        return {
+            "next_level": num,
+            "next_level_name": name,
+            "points_needed": threshold - total_points,
+            "next_threshold": threshold,
+        }
     return {
         "next_level": None,
         "next_level_name": None,
@@ -118,10 +129,18 @@ async def award_points(
         logger.warning(f"Unknown point action: {action}")
         return None
 
-    # Get or create UserPoints
-    stmt = select(UserPoints).where(UserPoints.user_id == user_id)
-    result = await db.execute(stmt)
-    user_points = result.scalar_one_or_none()
+    # Get or create UserPoints; for one-time events the "already awarded"
+    # check rides along in the same SELECT.
+    if action in ONE_TIME_EVENTS:
+        already_awarded = exists().where(PointLog.user_id == user_id, PointLog.action == action)
+    else:
+        already_awarded = literal(False)
+    stmt = select(UserPoints, already_awarded.label("already_awarded")).where(UserPoints.user_id == user_id)
+    row = (await db.execute(stmt)).one_or_none()
+    user_points = row.UserPoints if row else None
+
+    if user_points and row.already_awarded:
+        return user_points
 
     if not user_points:
         user_points = UserPoints(user_id=user_id, total_points=0, level=1, login_streak=0)
@@ -148,15 +167,6 @@ async def award_points(
         user_points.last_login_bonus = now_kst
         user_points.last_login_date = today_kst
 
-    # One-time events: check if already awarded
-    if action in ONE_TIME_EVENTS:
-        stmt = select(PointLog).where(
-            PointLog.user_id == user_id, PointLog.action == action
-        )
-        result = await db.execute(stmt)
-        if result.scalar_one_or_none():
-            return user_points
-
     # Daily-limited events
     if action in DAILY_LIMITS:
         limit = DAILY_LIMITS[action]
@@ -176,6 +186,7 @@ async def award_points(
     level_num, level_name = compute_level(user_points.total_points)
     user_points.level = level_num
     user_points.updated_at = datetime.now(timezone.utc)
+    queue_leaderboard_sync(db, user_id, user_points.total_points)
 
     # Log
     log = PointLog(
@@ -209,3 +220,106 @@ async def check_and_award_streak(db: AsyncSession, user_id):
         await award_points(db, user_id, "login_streak_7", "7일 연속 로그인 보너스")
     if streak >= 30:
         await award_points(db, user_id, "login_streak_30", "30일 연속 로그인 보너스")
+
+
+# ─── Leaderboard (Redis ZSET) ───────────────────────────────────────────
+
+# Sorted set of user_id -> total_points, kept in step with every points change
+# so /api/points/leaderboard is a ZREVRANGE instead of an ORDER BY.
+LEADERBOARD_KEY = "points:leaderboard:z"
+# Set by each rebuild; the API serves SQL until it exists. Outlives a few
+# missed beat runs of tasks.data_tasks.rebuild_leaderboard.
+LEADERBOARD_READY_KEY = f"{LEADERBOARD_KEY}:ready"
+LEADERBOARD_READY_TTL_S = 3600
+_REBUILD_BATCH = 5000
+NICKNAME_TTL_S = 86400
+
+
+def nickname_key(user_id) -> str:
+    return f"nick:{user_id}"
+
+
+# session.info key holding {user_id: total_points} awaiting commit.
+_PENDING_SYNC_KEY = "leaderboard_pending"
+# Strong references so scheduled syncs aren't garbage-collected mid-flight.
+_sync_tasks: set[asyncio.Task] = set()
+
+
+def queue_leaderboard_sync(db: AsyncSession, user_id, total_points: int) -> None:
+    """
+    Record a user's new total on the session. The ZSET write and author-info
+    invalidation run only once the session commits, so a rolled-back award
+    never leaves a phantom score or lets a stale author bundle be re-cached.
+    """
+    db.info.setdefault(_PENDING_SYNC_KEY, {})[str(user_id)] = total_points
+
+
+async def sync_leaderboard(totals: dict[str, int]) -> None:
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.zadd(LEADERBOARD_KEY, totals)
+            # Feed author bundles carry total_points for the level badge.
+            pipe.delete(*(author_info_key(user_id) for user_id in totals))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Leaderboard sync failed for users {list(totals)}: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_leaderboard_sync(session) -> None:
+    totals = session.info.pop(_PENDING_SYNC_KEY, None)
+    if not totals:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync sessions (scripts, migrations) have no loop; the periodic
+        # rebuild picks their changes up.
+        return
+    task = loop.create_task(sync_leaderboard(totals))
+    _sync_tasks.add(task)
+    task.add_done_callback(_sync_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_leaderboard_sync(session, previous_transaction) -> None:
+    # Savepoint rollbacks leave the outer transaction, and its queue, alive.
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_SYNC_KEY, None)
+
+
+async def rebuild_leaderboard(db: AsyncSession, r) -> int:
+    """
+    Reload every user's total into a temp key and RENAME it over the live
+    ZSET, so members lost to eviction or missed syncs are repaired without
+    readers ever seeing a half-built set. Returns the member count.
+    """
+    tmp_key = f"{LEADERBOARD_KEY}:rebuild:{uuid4().hex}"
+    count = 0
+    result = await db.stream(select(UserPoints.user_id, UserPoints.total_points))
+    async for rows in result.partitions(_REBUILD_BATCH):
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.zadd(tmp_key, {str(user_id): total_points or 0 for user_id, total_points in rows})
+            # A crashed run must not leave its temp key behind.
+            pipe.expire(tmp_key, 600)
+            await pipe.execute()
+        count += len(rows)
+    async with r.pipeline(transaction=True) as pipe:
+        if count:
+            pipe.rename(tmp_key, LEADERBOARD_KEY)
+            # RENAME carries the temp key's TTL over.
+            pipe.persist(LEADERBOARD_KEY)
+        else:
+            pipe.delete(LEADERBOARD_KEY)
+        pipe.set(LEADERBOARD_READY_KEY, "1", ex=LEADERBOARD_READY_TTL_S)
+        await pipe.execute()
+    return count
+
+
+async def cache_nickname(user_id, nickname: str) -> None:
+    try:
+        r = await get_redis()
+        await r.set(nickname_key(user_id), nickname, ex=NICKNAME_TTL_S)
+    except Exception as e:
+        logger.warning(f"Nickname cache failed for user {user_id}: {e}")
@@ -2,10 +2,10 @@
 Redis caching utility for BITRAM.
 Uses the redis.asyncio module (already in requirements.txt as redis==5.1.0).
 """
-import json
 import logging
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 
 from config import get_settings
@@ -14,6 +14,7 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 _pool: aioredis.ConnectionPool | None = None
+_bytes_pool: aioredis.ConnectionPool | None = None
 
 
 def _get_pool() -> aioredis.ConnectionPool:
@@ -31,12 +32,29 @@ async def get_redis() -> aioredis.Redis:
     return aioredis.Redis(connection_pool=_get_pool())
 
 
+def _get_bytes_pool() -> aioredis.ConnectionPool:
+    # Separate pool without decode_responses for payloads served verbatim.
+    global _bytes_pool
+    if _bytes_pool is None:
+        _bytes_pool = aioredis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=20,
+        )
+    return _bytes_pool
+
+
+def _dumps(value: Any) -> bytes:
+    # orjson encodes datetimes/UUIDs natively; default=str covers anything else
+    # (Decimal, custom types) the way json.dumps(default=str) used to.
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 async def cache_get(key: str) -> Any | None:
     try:
         r = await get_redis()
         val = await r.get(key)
         if val is not None:
-            return json.loads(val)
+            return orjson.loads(val)
         return None
     except Exception as e:
         logger.warning(f"Redis cache_get error: {e}")
@@ -46,11 +64,29 @@ async def cache_get(key: str) -> Any | None:
 async def cache_set(key: str, value: Any, ttl: int = 300) -> None:
     try:
         r = await get_redis()
-        await r.setex(key, ttl, json.dumps(value, default=str))
+        await r.setex(key, ttl, _dumps(value))
     except Exception as e:
         logger.warning(f"Redis cache_set error: {e}")
 
 
+async def cache_get_bytes(key: str) -> bytes | None:
+    """Raw cached payload (e.g. pre-encoded JSON), without decoding."""
+    try:
+        r = aioredis.Redis(connection_pool=_get_bytes_pool())
+        return await r.get(key)
+    except Exception as e:
+        logger.warning(f"Redis cache_get_bytes error: {e}")
+        return None
+
+
+async def cache_set_bytes(key: str, payload: bytes, ttl: int = 300) -> None:
+    try:
+        r = aioredis.Redis(connection_pool=_get_bytes_pool())
+        await r.setex(key, ttl, payload)
+    except Exception as e:
+        logger.warning(f"Redis cache_set_bytes error: {e}")
+
+
 async def cache_delete(key: str) -> None:
     try:
         r = await get_redis()
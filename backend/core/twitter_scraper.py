@@ -6,10 +6,12 @@ ct0(CSRF) 토큰은 자동으로 발급받습니다.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import time
 import urllib.parse
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -87,6 +89,26 @@ _CT0_TTL = 3600  # 1시간
 # user_id 캐시 (screen_name -> rest_id)
 _uid_cache: dict[str, str] = {}
 
+# 동일 계정 묶음에 대한 동시 수집 방지용 락 ((loop id, cache_key) -> [Lock, 대기 수]).
+# Lock은 생성된 이벤트 루프에 묶이므로 루프별로 두고, 쓰는 태스크가 없으면 제거한다.
+_multi_locks: dict[tuple[int, str], list] = {}
+
+
+@asynccontextmanager
+async def _multi_lock(cache_key: str):
+    key = (id(asyncio.get_running_loop()), cache_key)
+    entry = _multi_locks.get(key)
+    if entry is None:
+        entry = _multi_locks[key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _multi_locks[key]
+
 
 @dataclass
 class ScrapedTweet:
@@ -302,30 +324,56 @@ async def fetch_multiple_users_tweets(
     per_user: int = 5,
     total_limit: int = 30,
 ) -> list[ScrapedTweet]:
-    """여러 유저의 트윗을 가져와서 시간순으로 합친다."""
-    cache_key = f"multi:{','.join(sorted(usernames))}:{per_user}:{total_limit}"
+    """여러 유저의 트윗을 가져와서 시간순으로 합친다.
+
+    합친 전체 목록을 계정 묶음 단위로 캐시하고 total_limit 만큼 잘라 반환하므로,
+    limit 값이 달라도 같은 캐시를 공유한다. 캐시 미스가 동시에 발생해도 락으로
+    한 번만 수집한다.
+    """
+    cache_key = f"multi:{','.join(sorted(usernames))}:{per_user}"
     cached = _cache.get(cache_key)
     if cached and (time.time() - cached[0]) < _CACHE_TTL:
-        return cached[1]
+        return cached[1][:total_limit]
+
+    async with _multi_lock(cache_key):
+        cached = _cache.get(cache_key)
+        if cached and (time.time() - cached[0]) < _CACHE_TTL:
+            return cached[1][:total_limit]
+
+        result = await _collect_users_tweets(auth_token, usernames, per_user)
+        if result is None:
+            return []
+        _cache[cache_key] = (time.time(), result)
+        return result[:total_limit]
+
 
+async def _collect_users_tweets(
+    auth_token: str,
+    usernames: list[str],
+    per_user: int,
+) -> list[ScrapedTweet] | None:
     all_tweets: list[ScrapedTweet] = []
 
     async with httpx.AsyncClient() as client:
         ct0 = await _get_ct0(client, auth_token)
         if not ct0:
             logger.error("Cannot fetch tweets: no ct0 token")
-            return []
-
-        import asyncio as _aio
-        for idx, username in enumerate(usernames):
+            return None
+
+        rate_limited = False
+
+        async def _fetch_user(idx: int, username: str) -> list[ScrapedTweet]:
+            nonlocal rate_limited
+            # Rate limit 방지: 요청 시작 시점을 계정마다 1.5초씩 벌려 둔다.
+            # (응답 대기는 서로 겹치므로 전체 소요 시간은 지연 합계만큼만 걸린다)
+            if idx > 0:
+                await asyncio.sleep(1.5 * idx)
+            if rate_limited:
+                return []
             try:
-                # Rate limit 방지: 2번째 유저부터 1.5초 딜레이
-                if idx > 0:
-                    await _aio.sleep(1.5)
-
                 user_id = await _resolve_user_id(client, auth_token, ct0, username)
                 if not user_id:
-                    continue
+                    return []
 
                 query_id = "E3opETHurmVJflFsUBVuUQ"
                 variables = {
@@ -337,18 +385,22 @@ async def fetch_multiple_users_tweets(
                     "withV2Timeline": True,
                 }
                 data = await _graphql_get(client, auth_token, ct0, query_id, "UserTweets", variables)
-                tweets = _parse_tweets(data)
-                all_tweets.extend(tweets[:per_user])
-                logger.info("Fetched %d tweets from @%s", len(tweets[:per_user]), username)
+                tweets = _parse_tweets(data)[:per_user]
+                logger.info("Fetched %d tweets from @%s", len(tweets), username)
+                return tweets
             except RateLimitError:
-                logger.warning("Rate limited at @%s (idx=%d), stopping early with %d tweets", username, idx, len(all_tweets))
-                break
+                if not rate_limited:
+                    logger.warning("Rate limited at @%s (idx=%d), skipping remaining accounts", username, idx)
+                rate_limited = True
+                return []
             except Exception as e:
                 logger.warning("Failed to fetch tweets for @%s: %s", username, e)
-                continue
+                return []
+
+        results = await asyncio.gather(*[_fetch_user(i, u) for i, u in enumerate(usernames)])
+        for tweets in results:
+            all_tweets.extend(tweets)
 
     # 시간순 정렬 (최신 먼저)
     all_tweets.sort(key=lambda t: t.published_ts or 0, reverse=True)
-    result = all_tweets[:total_limit]
-    _cache[cache_key] = (time.time(), result)
-    return result
+    return all_tweets
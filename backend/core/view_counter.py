@@ -0,0 +1,88 @@
+"""
+Write-behind post view counter.
+
+Views are buffered in a Redis hash (post_id -> pending views) shared by all API
+workers and folded into posts.view_count by a periodic Celery task, so reading a
+post does not write to the posts table.
+"""
+import logging
+from uuid import UUID
+
+from sqlalchemy import Integer, column, func, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Post
+from core.redis_cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "posts:views:pending"
+# The pending hash is renamed here before flushing so views recorded during the
+# flush land in a fresh hash instead of being lost or double-counted.
+FLUSHING_KEY = "posts:views:flushing"
+
+
+async def record_view(post_id: UUID) -> int | None:
+    """Buffer one view. Returns the post's unflushed view count, or None if Redis is unavailable."""
+    try:
+        r = await get_redis()
+        return await r.hincrby(PENDING_KEY, str(post_id), 1)
+    except Exception as e:
+        logger.warning(f"record_view failed for {post_id}: {e}")
+        return None
+
+
+async def pending_views(post_ids) -> dict[UUID, int]:
+    """Unflushed views per post (pending plus any batch mid-flush); empty if Redis is unavailable."""
+    if not post_ids:
+        return {}
+    fields = [str(pid) for pid in post_ids]
+    try:
+        r = await get_redis()
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.hmget(PENDING_KEY, fields)
+            pipe.hmget(FLUSHING_KEY, fields)
+            pending, flushing = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"pending_views failed: {e}")
+        return {}
+    return {
+        pid: int(a or 0) + int(b or 0)
+        for pid, a, b in zip(post_ids, pending, flushing)
+        if a or b
+    }
+
+
+async def flush_views(db: AsyncSession, r=None) -> int:
+    """Apply buffered views to posts.view_count in one UPDATE. Returns the number of posts touched.
+
+    Pass r (a decode_responses client) when running outside the API event loop,
+    since the shared pool's connections belong to the loop that opened them.
+    """
+    if r is None:
+        r = await get_redis()
+    # A leftover FLUSHING_KEY means the previous flush failed before committing;
+    # apply it first and only then take the next batch.
+    if not await r.exists(FLUSHING_KEY):
+        try:
+            await r.rename(PENDING_KEY, FLUSHING_KEY)
+        except Exception:
+            return 0  # nothing pending (RENAME on a missing key errors)
+
+    pending = await r.hgetall(FLUSHING_KEY)
+    rows = [(UUID(pid), int(n)) for pid, n in pending.items() if int(n) > 0]
+    if rows:
+        t = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("views", Integer),
+            name="t",
+        ).data(rows)
+        await db.execute(
+            update(Post)
+            .where(Post.id == t.c.id)
+            .values(view_count=func.coalesce(Post.view_count, 0) + t.c.views, updated_at=Post.updated_at)
+        )
+        await db.commit()
+    await r.delete(FLUSHING_KEY)
+    return len(rows)
@@ -1,20 +1,58 @@
+from uuid import uuid4
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 from config import get_settings
 
 settings = get_settings()
 
+_connect_args: dict = {
+    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+}
+if not settings.DB_PGBOUNCER:
+    # PgBouncer rejects unknown startup parameters; behind it, jit=off comes
+    # from the database default (migration 018) instead.
+    _connect_args["server_settings"] = {"jit": "off"}
+else:
+    # Transaction pooling hands each transaction a different server connection,
+    # so named prepared statements must be unique and never cached client-side.
+    _connect_args.update(
+        statement_cache_size=0,
+        prepared_statement_cache_size=0,
+        prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+    )
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.APP_ENV == "development",
-    pool_size=20,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=_connect_args,
 )
 
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def create_task_engine(pool_size: int = 1):
+    """
+    Engine for a single Celery task run. asyncio.run() gives each run a new event
+    loop, so tasks can't share `engine`'s pooled connections; this keeps the same
+    connect args (PgBouncer-safe statement caching, jit) and recycle settings.
+    Callers must `await task_engine.dispose()` when the run ends.
+    """
+    return create_async_engine(
+        settings.DATABASE_URL,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args=_connect_args,
+    )
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -2,10 +2,10 @@ import uuid
 from datetime import datetime, timezone
 from sqlalchemy import (
     Column, String, Boolean, Integer, Float, Text, DateTime, Date, Enum, ForeignKey,
-    UniqueConstraint, Index, Numeric, JSON,
+    UniqueConstraint, Index, Numeric, JSON, Computed, func,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from db.database import Base
 
 
@@ -42,6 +42,7 @@ class User(Base):
     bio = Column(Text, nullable=True)
     social_links = Column(JSONB, nullable=True)  # {"twitter": "...", "website": "..."}
     is_active = Column(Boolean, default=True)
+    follower_count = Column(Integer, default=0, server_default="0", nullable=False)  # denormalized from follows
     created_at = Column(DateTime(timezone=True), default=utcnow)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
 
@@ -116,6 +117,15 @@ class Strategy(Base):
     config_json = Column(JSONB, nullable=False)  # Full strategy config
     is_public = Column(Boolean, default=False)
     backtest_result = Column(JSONB, nullable=True)
+    # Extracted from backtest_result so the marketplace "profit" sort can use an index.
+    backtest_total_return_pct = Column(
+        Float,
+        Computed(
+            "CASE WHEN jsonb_typeof(backtest_result->'total_return_pct') = 'number' "
+            "THEN (backtest_result->>'total_return_pct')::double precision END",
+            persisted=True,
+        ),
+    )
     copy_count = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), default=utcnow)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
@@ -126,9 +136,28 @@ class Strategy(Base):
     __table_args__ = (
         Index("ix_strategies_user_id", "user_id"),
         Index("ix_strategies_public", "is_public"),
+        # Marketplace sorts only ever read public rows; partial indexes keep
+        # them to that subset.
+        Index("ix_strategies_public_copies", copy_count.desc(), id.desc(), postgresql_where=is_public),
+        Index("ix_strategies_public_created", created_at.desc(), id.desc(), postgresql_where=is_public),
+        Index(
+            "ix_strategies_public_profit",
+            backtest_total_return_pct.desc().nullslast(), id.desc(),
+            postgresql_where=is_public,
+        ),
+        Index("ix_strategies_public_pair_timeframe", "pair", "timeframe", postgresql_where=is_public),
     )
 
 
+class MarketplaceCount(Base):
+    """Public strategy totals per (pair, timeframe); '' means "any". Kept by a DB trigger."""
+    __tablename__ = "marketplace_counts"
+
+    pair = Column(String(20), primary_key=True, default="")
+    timeframe = Column(String(10), primary_key=True, default="")
+    total = Column(Integer, nullable=False, default=0)
+
+
 # ─── Bots ────────────────────────────────────────────────────────────────────
 
 class Bot(Base):
@@ -250,12 +279,36 @@ class Post(Base):
     series_id = Column(UUID(as_uuid=True), ForeignKey("post_series.id", ondelete="SET NULL"), nullable=True)
     series_order = Column(Integer, nullable=True)
     verified_profit = Column(JSONB, nullable=True)
+    # Extracted from verified_profit so list views and the strategy ranking skip JSON parsing.
+    verified_profit_pct = Column(
+        Float,
+        Computed(
+            "CASE WHEN jsonb_typeof(verified_profit->'total_return_pct') = 'number' "
+            "THEN (verified_profit->>'total_return_pct')::double precision END",
+            persisted=True,
+        ),
+    )
     image_urls = Column(JSONB, nullable=True)  # list of image URLs
-    like_count = Column(Integer, default=0)
-    comment_count = Column(Integer, default=0)
+    # Keyset sort keys for the post list (migration 010): NULLs would drop
+    # rows out of tuple comparisons after the first page.
+    like_count = Column(Integer, default=0, server_default="0", nullable=False)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)
     view_count = Column(Integer, default=0)
-    is_pinned = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), default=utcnow)
+    is_pinned = Column(Boolean, default=False, server_default="false", nullable=False)
+    # Trending/feed engagement weight, kept by Postgres. Deliberately unindexed:
+    # it moves with view_count, and an index on it would make every view flush
+    # a non-HOT update.
+    engagement_score = Column(
+        Integer,
+        Computed(
+            "COALESCE(like_count, 0) * 2 + COALESCE(comment_count, 0) * 3 + COALESCE(view_count, 0)",
+            persisted=True,
+        ),
+    )
+    # to_tsvector('simple', title || ' ' || content), maintained by the
+    # posts_search_vector_trigger (migration 001); only read by search.
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utcnow, onupdate=utcnow)
 
     user = relationship("User", back_populates="posts")
@@ -267,6 +320,24 @@ class Post(Base):
         Index("ix_posts_category", "category"),
         Index("ix_posts_created_at", "created_at"),
         Index("ix_posts_user_id", "user_id"),
+        # Keyset pagination for list_posts (pinned first, then sort key, id tiebreak)
+        Index("ix_posts_pinned_created", is_pinned.desc(), created_at.desc(), id.desc()),
+        Index("ix_posts_pinned_likes", is_pinned.desc(), like_count.desc(), id.desc()),
+        Index("ix_posts_pinned_comments", is_pinned.desc(), comment_count.desc(), id.desc()),
+        Index("ix_posts_category_pinned_created", category, is_pinned.desc(), created_at.desc(), id.desc()),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_posts_verified_profit_pct",
+            verified_profit_pct.desc(),
+            postgresql_where=verified_profit.isnot(None),
+        ),
+        # Week/month windows of the strategy ranking: range scan on created_at
+        # over just the verified strategy/profit posts.
+        Index(
+            "ix_posts_ranking_created",
+            created_at.desc(),
+            postgresql_where=verified_profit.isnot(None) & category.in_(["strategy", "profit"]),
+        ),
     )
 
 
@@ -288,7 +359,8 @@ class Comment(Base):
     parent = relationship("Comment", remote_side=[id], backref="replies")
 
     __table_args__ = (
-        Index("ix_comments_post_id", "post_id"),
+        # Thread walk in list_comments: roots (parent_id IS NULL) and replies per parent.
+        Index("ix_comments_post_parent", "post_id", "parent_id", "created_at"),
     )
 
 
@@ -354,8 +426,11 @@ class Report(Base):
     status = Column(String(20), default="pending")  # pending, reviewed, dismissed
     created_at = Column(DateTime(timezone=True), default=utcnow)
 
+    reporter = relationship("User", foreign_keys=[reporter_id])
+
     __table_args__ = (
         Index("ix_reports_status", "status"),
+        Index("ix_reports_pending_created_at", "created_at", postgresql_where=status == "pending"),
     )
 
 
@@ -468,6 +543,7 @@ class PointLog(Base):
     __table_args__ = (
         Index("ix_point_logs_user_id", "user_id"),
         Index("ix_point_logs_created_at", "created_at"),
+        Index("ix_point_logs_user_created_id", "user_id", "created_at", "id"),
     )
 
 
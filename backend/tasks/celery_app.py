@@ -41,6 +41,18 @@ app.conf.beat_schedule = {
         "schedule": 3600.0,
         "args": ("1h",),
     },
+    "flush-post-views": {
+        "task": "tasks.data_tasks.flush_post_views",
+        "schedule": 5.0,  # Every 5 seconds
+    },
+    "refresh-trending-posts": {
+        "task": "tasks.data_tasks.refresh_trending_posts",
+        "schedule": 60.0,  # Every minute
+    },
+    "rebuild-leaderboard": {
+        "task": "tasks.data_tasks.rebuild_leaderboard",
+        "schedule": 900.0,  # Every 15 minutes
+    },
     "check-subscriptions": {
         "task": "tasks.data_tasks.check_expired_subscriptions",
         "schedule": crontab(hour=0, minute=5),
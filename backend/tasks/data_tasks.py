@@ -63,6 +63,73 @@ async def _collect_ohlcv_async(timeframe: str):
                 continue
 
 
+@app.task(name="tasks.data_tasks.flush_post_views")
+def flush_post_views():
+    """Apply Redis-buffered post views to posts.view_count."""
+    asyncio.run(_flush_post_views_async())
+
+
+async def _flush_post_views_async():
+    import redis.asyncio as aioredis
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+    from db.database import create_task_engine
+    from core.view_counter import flush_views
+
+    # asyncio.run() opens a new loop per run; the module-level engine and redis
+    # pool hold connections bound to earlier (closed) loops, so use fresh ones.
+    task_engine = create_task_engine()
+    TaskSession = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        async with TaskSession() as db:
+            await flush_views(db, r)
+    finally:
+        await r.aclose()
+        await task_engine.dispose()
+
+
+@app.task(name="tasks.data_tasks.refresh_trending_posts")
+def refresh_trending_posts():
+    """Recompute the trending_posts_mv engagement scores."""
+    asyncio.run(_refresh_trending_posts_async())
+
+
+async def _refresh_trending_posts_async():
+    from sqlalchemy import text
+    from db.database import create_task_engine
+
+    # Fresh engine per run: asyncio.run() gives each run its own event loop.
+    task_engine = create_task_engine()
+    try:
+        async with task_engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY trending_posts_mv"))
+    finally:
+        await task_engine.dispose()
+
+
+@app.task(name="tasks.data_tasks.rebuild_leaderboard")
+def rebuild_leaderboard():
+    """Reload the points leaderboard ZSET from user_points."""
+    asyncio.run(_rebuild_leaderboard_async())
+
+
+async def _rebuild_leaderboard_async():
+    import redis.asyncio as aioredis
+    from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+    from db.database import create_task_engine
+    from core.points import rebuild_leaderboard as rebuild
+
+    task_engine = create_task_engine()
+    TaskSession = async_sessionmaker(task_engine, class_=AsyncSession, expire_on_commit=False)
+    r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        async with TaskSession() as db:
+            await rebuild(db, r)
+    finally:
+        await r.aclose()
+        await task_engine.dispose()
+
+
 @app.task(name="tasks.data_tasks.check_expired_subscriptions")
 def check_expired_subscriptions():
     """Check and expire old subscriptions."""
@@ -73,6 +140,7 @@ async def _check_subscriptions_async():
     from db.database import AsyncSessionLocal
     from db.models import Subscription, User
     from sqlalchemy import select, update
+    from core.author_info import invalidate_author_info
 
     async with AsyncSessionLocal() as db:
         now = datetime.now(timezone.utc)
@@ -87,6 +155,7 @@ async def _check_subscriptions_async():
         result = await db.execute(stmt)
         expired = result.scalars().all()
 
+        downgraded = []
         for sub in expired:
             if sub.status == "cancelled":
                 sub.plan = "free"
@@ -94,6 +163,16 @@ async def _check_subscriptions_async():
                 await db.execute(
                     update(User).where(User.id == sub.user_id).values(plan="free")
                 )
+                downgraded.append(sub.user_id)
             # TODO: Auto-renew for active subscriptions
 
         await db.commit()
+        if downgraded:
+            import redis.asyncio as aioredis
+
+            r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            try:
+                for user_id in downgraded:
+                    await invalidate_author_info(user_id, r)
+            finally:
+                await r.aclose()
@@ -1,5 +1,5 @@
 "use client";
-import { useEffect, useState, useCallback, Suspense, useMemo } from "react";
+import { useEffect, useState, useCallback, Suspense, useMemo, useRef } from "react";
 import { useRouter, useSearchParams } from "next/navigation";
 import Link from "next/link";
 import { api } from "@/lib/api";
@@ -67,6 +67,8 @@ function CommunityContent() {
   const [sort, setSort] = useState("latest");
   const [page, setPage] = useState(1);
   const [hasMore, setHasMore] = useState(true);
+  // Cursor that loads each page of the main post list (index = page - 1).
+  const cursorsRef = useRef<(string | undefined)[]>([]);
   const [searchQuery, setSearchQuery] = useState("");
 
   const [boards, setBoards] = useState<CommunityBoard[]>([]);
@@ -80,6 +82,7 @@ function CommunityContent() {
     setLoading(true);
     try {
       let result: PostListItem[];
+      let more: boolean | null = null;
       if (searchQuery.trim()) {
         result = await api.searchPosts(searchQuery.trim(), undefined, page);
       } else if (activeBoard !== "all") {
@@ -95,10 +98,13 @@ function CommunityContent() {
           is_pinned: false, created_at: t.created_at,
         }));
       } else {
-        result = await api.getPosts({ sort, page });
+        const res = await api.getPosts({ sort, cursor: cursorsRef.current[page - 1] });
+        result = res.items;
+        more = res.has_more;
+        cursorsRef.current[page] = res.next_cursor ?? undefined;
       }
       setPosts(result);
-      setHasMore(sort !== "trending" && sort !== "recommended" && result.length >= 20);
+      setHasMore(more ?? (sort !== "trending" && sort !== "recommended" && result.length >= 20));
     } catch (err) {
       console.error("Failed to fetch posts:", err);
     } finally {
@@ -106,6 +112,10 @@ function CommunityContent() {
     }
   }, [activeBoard, sort, page, searchQuery]);
 
+  // Cursors belong to one board/sort/search listing; drop them whenever it changes.
+  // Declared before the fetch effect so the first fetch of the new listing sees the reset.
+  useEffect(() => { cursorsRef.current = []; }, [activeBoard, sort, searchQuery]);
+
   useEffect(() => { fetchPosts(); }, [fetchPosts]);
 
   const handleBoardChange = (slug: string) => { setActiveBoard(slug); setPage(1); setSearchQuery(""); };
@@ -696,7 +696,7 @@ function PointsSection() {
 
   useEffect(() => {
     if (showHistory && history.length === 0) {
-      api.getPointHistory().then(setHistory).catch(() => {});
+      api.getPointHistory().then((res) => setHistory(res.items)).catch(() => {});
     }
   }, [showHistory, history.length]);
 
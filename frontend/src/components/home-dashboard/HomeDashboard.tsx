@@ -256,7 +256,7 @@ export default function HomeDashboard({ embedded = false }: { embedded?: boolean
     const [q, t, l, hs, tt] = await Promise.all([
       api.getMarketQuotes().catch(() => ({ quotes: [] as MarketQuote[] })),
       api.getTrending().catch(() => [] as TrendingPost[]),
-      api.getPosts({ sort: "latest", page: 1 }).catch(() => [] as PostListItem[]),
+      api.getPosts({ sort: "latest" }).then((res) => res.items).catch(() => [] as PostListItem[]),
       api.getHotStrategies().catch(() => [] as HotStrategy[]),
       api.getTopTraders("week").catch(() => [] as TopTrader[]),
     ]);
@@ -258,12 +258,12 @@ class ApiClient {
   }
 
   // ─── Community ─────────────────────────────────────────────────────
-  getPosts(params: { category?: string; sort?: string; page?: number } = {}) {
+  getPosts(params: { category?: string; sort?: string; cursor?: string } = {}) {
     const qs = new URLSearchParams();
     if (params.category) qs.set("category", params.category);
     if (params.sort) qs.set("sort", params.sort);
-    if (params.page) qs.set("page", String(params.page));
-    return this.request<import("@/types").PostListItem[]>(`/api/posts?${qs}`);
+    if (params.cursor) qs.set("cursor", params.cursor);
+    return this.request<import("@/types").PostListPage>(`/api/posts?${qs}`);
   }
   getPost(id: string) {
     return this.request<import("@/types").Post>(`/api/posts/${id}`);
@@ -400,8 +400,9 @@ class ApiClient {
   getMyPoints() {
     return this.request<import("@/types").UserPointsInfo>("/api/points/me");
   }
-  getPointHistory(page = 1) {
-    return this.request<import("@/types").PointLogItem[]>(`/api/points/history?page=${page}`);
+  getPointHistory(cursor?: string) {
+    const qs = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    return this.request<import("@/types").PointHistoryPage>(`/api/points/history${qs}`);
   }
   getPointLeaderboard() {
     return this.request<import("@/types").PointLeaderboardItem[]>("/api/points/leaderboard");
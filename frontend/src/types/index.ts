@@ -193,6 +193,12 @@ export interface PostListItem {
   created_at: string;
 }
 
+export interface PostListPage {
+  items: PostListItem[];
+  next_cursor: string | null;
+  has_more: boolean;
+}
+
 export interface Comment {
   id: string;
   author: Author;
@@ -400,6 +406,11 @@ export interface PointLogItem {
   created_at: string;
 }
 
+export interface PointHistoryPage {
+  items: PointLogItem[];
+  next_cursor: string | null;
+}
+
 export interface PointLeaderboardItem {
   rank: number;
   user_id: string;